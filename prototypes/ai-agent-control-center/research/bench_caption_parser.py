@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Caption Parser Benchmark
+Compares the streaming VTT parser in youtube_transcript_extractor.py with
+the old read-everything parser on a synthetic multi-hour auto-caption file.
+
+The file mimics YouTube auto-captions: word-timed rolling cues, each
+repeating the previous line, plus 10ms snapshot cues - the layout that
+made the old parser's transcripts nearly twice as long as the speech.
+
+Usage:
+    python3 bench_caption_parser.py
+    python3 bench_caption_parser.py --hours 6
+"""
+
+import argparse
+import os
+import random
+import re
+import tempfile
+import time
+import tracemalloc
+
+from youtube_transcript_extractor import read_caption_file
+
+WORDS = (
+    "so the thing about building agents is that you have to think about "
+    "what the model actually sees at each step and then give it tools that "
+    "match how a person would do the job if they were sitting there"
+).split()
+
+
+def timestamp(seconds: float) -> str:
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{int(hours):02d}:{int(minutes):02d}:{secs:06.3f}"
+
+
+def write_auto_captions(path: str, hours: float, seed: int = 1) -> int:
+    """Write a YouTube-style auto-caption VTT file; returns its line count"""
+    rng = random.Random(seed)
+    lines = ["WEBVTT", "Kind: captions", "Language: en", ""]
+    clock = 0.0
+    previous = ""
+    while clock < hours * 3600:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(5, 9))]
+        length = rng.uniform(2.0, 3.5)
+        step = length / len(words)
+
+        # Rolling cue: the previous line, then the new one with word timings
+        timed = words[0] + "".join(
+            f"<{timestamp(clock + step * (i + 1))}><c> {word}</c>"
+            for i, word in enumerate(words[1:])
+        )
+        lines += [
+            f"{timestamp(clock)} --> {timestamp(clock + length)} align:start position:0%",
+            previous or " ",
+            timed,
+            ""
+        ]
+        previous = " ".join(words)
+        clock += length
+
+        # Snapshot cue repeating the finished line
+        lines += [
+            f"{timestamp(clock)} --> {timestamp(clock + 0.01)} align:start position:0%",
+            previous,
+            " ",
+            ""
+        ]
+        clock += 0.01
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines))
+    return len(lines)
+
+
+def legacy_parse(path: str) -> str:
+    """The parser _extract_with_ytdlp used before"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    lines = content.split('\n')
+    text_lines = []
+
+    for line in lines:
+        if '-->' not in line and line.strip() and not line.startswith('WEBVTT'):
+            clean_line = re.sub(r'<[^>]+>', '', line)
+            if clean_line.strip():
+                text_lines.append(clean_line.strip())
+
+    return ' '.join(text_lines)
+
+
+def measure(parse, path: str, runs: int = 3):
+    """Best-of-N time, then peak memory from a separate traced run"""
+    elapsed = float('inf')
+    for _ in range(runs):
+        started = time.perf_counter()
+        text = parse(path)
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    tracemalloc.start()
+    parse(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return text, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the VTT caption parser")
+    parser.add_argument("--hours", type=float, default=3.0, help="Length of the synthetic video")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "captions.en.vtt")
+        line_count = write_auto_captions(path, args.hours)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{args.hours:g}h auto-caption file: {line_count:,} lines, {size_mb:.1f} MB\n")
+
+        old_text, old_time, old_peak = measure(legacy_parse, path)
+        new_text, new_time, new_peak = measure(lambda p: read_caption_file(p)[0], path)
+
+    print(f"{'':10} {'time':>8} {'peak mem':>10} {'transcript':>12}")
+    print(f"{'legacy':10} {old_time:7.2f}s {old_peak / 1e6:8.1f}MB {len(old_text):>10,} ch")
+    print(f"{'streaming':10} {new_time:7.2f}s {new_peak / 1e6:8.1f}MB {len(new_text):>10,} ch")
+    print(f"\nTranscript is {len(new_text) / len(old_text):.0%} of the legacy size")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Transcript Extraction Benchmark
+Reproducible replacement for test-transcript-methods.py's manual runs.
+
+Fixtures in bench_fixtures/ are replayed through a local stub HTTP
+server standing in for YouTube, so results don't depend on the network,
+YouTube's mood, or which videos still have captions:
+
+    <id>.json     caption tracks + snippets (served as timedtext XML and
+                  parsed by youtube-transcript-api's own parser)
+    <id>.en.vtt   the subtitle file yt-dlp would download
+
+The fixtures are synthetic and small (a few minutes, under 100 snippets
+each). synthTalk01 is manually captioned; synthPod002 is the same
+script as auto-captions - rolling VTT cues and [Music] markers - so
+both methods should clean it to the same text, which the quality
+numbers check. At this size the timings are dominated by the stub
+latency and per-request overhead: use them to spot regressions between
+commits, not as a measure of parsing speed on real videos
+(bench_caption_parser.py covers multi-hour caption files).
+
+Each method of TranscriptExtractor is measured for latency (p50/p95),
+throughput with concurrent workers, peak memory, and output quality
+(word count, duplicate ratio). Results are JSON so runs can be diffed
+across commits.
+
+Usage:
+    python3 bench_transcript_methods.py
+    python3 bench_transcript_methods.py --latency 0.05 --rounds 20 --output results.json
+    python3 bench_transcript_methods.py --compare results.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+import types
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape, quoteattr
+
+import requests
+from youtube_transcript_api._transcripts import Transcript, TranscriptList
+
+from youtube_transcript_extractor import TranscriptExtractor
+import transcript_source
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, "bench_fixtures")
+
+
+def load_fixtures() -> dict:
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.json"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        vtt_path = os.path.join(FIXTURES, f"{data['video_id']}.en.vtt")
+        with open(vtt_path, 'r', encoding='utf-8') as f:
+            data['vtt'] = f.read()
+        fixtures[data['video_id']] = data
+    return fixtures
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def timedtext_xml(snippets: list) -> str:
+    """Snippets in the XML format YouTube's timedtext endpoint returns"""
+    rows = "".join(
+        f"<text start={quoteattr(str(s['start']))} dur={quoteattr(str(s['duration']))}>"
+        f"{escape(s['text'])}</text>"
+        for s in snippets
+    )
+    return f'<?xml version="1.0" encoding="utf-8" ?><transcript>{rows}</transcript>'
+
+
+def start_stub_server(fixtures: dict, latency: float) -> str:
+    """
+    Serve the fixtures after `latency` seconds per request:
+
+        /list/<id>       caption tracks (JSON)
+        /timedtext/<id>  transcript (XML)
+        /vtt/<id>        subtitle file
+    """
+    bodies = {}
+    for video_id, data in fixtures.items():
+        bodies[f"/list/{video_id}"] = json.dumps(data['tracks'])
+        bodies[f"/timedtext/{video_id}"] = timedtext_xml(data['snippets'])
+        bodies[f"/vtt/{video_id}"] = data['vtt']
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = bodies.get(self.path.split("?")[0])
+            if body is None:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    port = free_port()
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{port}"
+
+
+def replay_transcript_api(base_url: str):
+    """
+    YouTubeTranscriptApi stand-in: list() hits the stub, and the tracks it
+    returns are the library's real Transcript objects pointed at the stub,
+    so fetch() and XML parsing run unmodified.
+    """
+    session = requests.Session()
+
+    class ReplayTranscriptApi:
+        def list(self, video_id: str) -> TranscriptList:
+            tracks = session.get(f"{base_url}/list/{video_id}").json()
+            manual, generated = {}, {}
+            for track in tracks:
+                transcript = Transcript(
+                    session, video_id,
+                    f"{base_url}/timedtext/{video_id}?lang={track['language_code']}",
+                    track['language'], track['language_code'], track['is_generated'], []
+                )
+                (generated if track['is_generated'] else manual)[track['language_code']] = transcript
+            return TranscriptList(video_id, manual, generated, [])
+
+    return ReplayTranscriptApi
+
+
+def replay_yt_dlp(base_url: str) -> types.ModuleType:
+    """
+    yt_dlp stand-in: extract_info() downloads the fixture's .vtt from the
+    stub to where yt-dlp would have written it.
+    """
+    class ReplayYoutubeDL:
+        def __init__(self, opts: dict):
+            self.opts = opts
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def extract_info(self, url: str, download: bool = True) -> dict:
+            video_id = url.rsplit("v=", 1)[1]
+            language = self.opts['subtitleslangs'][0]
+            path = self.opts['outtmpl'].replace("%(id)s", video_id).replace(
+                "%(ext)s", f"{language}.vtt"
+            )
+            urllib.request.urlretrieve(f"{base_url}/vtt/{video_id}", path)
+            return {'id': video_id, 'title': video_id, 'duration': 0}
+
+    module = types.ModuleType("yt_dlp")
+    module.YoutubeDL = ReplayYoutubeDL
+    return module
+
+
+def duplicate_ratio(text: str, size: int = 4) -> float:
+    """Share of word 4-grams that already appeared earlier in the text"""
+    words = text.split()
+    shingles = [tuple(words[i:i + size]) for i in range(len(words) - size + 1)]
+    if not shingles:
+        return 0.0
+    return round(1 - len(set(shingles)) / len(shingles), 4)
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def bench_method(run, video_ids: list, rounds: int, workers: int) -> dict:
+    # Quality: one pass per fixture
+    videos = {}
+    for video_id in video_ids:
+        result = run(video_id)
+        text = result.get('transcript') or ""
+        videos[video_id] = {
+            "success": result['success'],
+            "error": result.get('error'),
+            "char_count": len(text),
+            "word_count": len(text.split()),
+            "duplicate_ratio": duplicate_ratio(text)
+        }
+
+    # Latency: sequential, so requests don't queue behind each other
+    latencies = []
+    for _ in range(rounds):
+        for video_id in video_ids:
+            started = time.perf_counter()
+            run(video_id)
+            latencies.append(time.perf_counter() - started)
+
+    # Throughput: the same work spread over `workers` threads
+    jobs = video_ids * rounds
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run, jobs))
+    wall = time.perf_counter() - started
+
+    # Peak memory: separate traced pass (tracing skews timings)
+    tracemalloc.start()
+    for video_id in video_ids:
+        run(video_id)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "latency_ms": {
+            "p50": round(statistics.median(latencies) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2)
+        },
+        "throughput_vps": round(len(jobs) / wall, 1),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "videos": videos
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=HERE, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(baseline: dict, current: dict):
+    """Print current vs baseline for every shared metric"""
+    print(f"\nvs {baseline.get('commit', '?')}:")
+    rows = []
+    for name, now in current["methods"].items():
+        before = baseline.get("methods", {}).get(name)
+        if not before:
+            continue
+        rows += [
+            (name, "latency p50 ms", before["latency_ms"]["p50"], now["latency_ms"]["p50"]),
+            (name, "latency p95 ms", before["latency_ms"]["p95"], now["latency_ms"]["p95"]),
+            (name, "throughput v/s", before["throughput_vps"], now["throughput_vps"]),
+            (name, "peak memory KB", before["peak_memory_kb"], now["peak_memory_kb"]),
+        ]
+        for video_id, quality in now["videos"].items():
+            old = before["videos"].get(video_id)
+            if old:
+                rows.append((name, f"{video_id} words", old["word_count"], quality["word_count"]))
+                rows.append((name, f"{video_id} dup ratio", old["duplicate_ratio"], quality["duplicate_ratio"]))
+    for name, metric, old, new in rows:
+        change = f"{(new - old) / old:+.0%}" if old else "n/a"
+        print(f"  {name:24} {metric:24} {old:>10} -> {new:<10} {change}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transcript extraction methods")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stub server delay per request (s)")
+    parser.add_argument("--rounds", type=int, default=10, help="Passes over the fixtures per method")
+    parser.add_argument("--workers", type=int, default=8, help="Threads for the throughput pass")
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    base_url = start_stub_server(fixtures, args.latency)
+    transcript_source.YouTubeTranscriptApi = replay_transcript_api(base_url)
+    sys.modules["yt_dlp"] = replay_yt_dlp(base_url)
+
+    extractor = TranscriptExtractor(cache_enabled=False)
+    methods = {
+        "youtube-transcript-api": extractor._extract_with_youtube_transcript_api,
+        "yt-dlp": extractor._extract_with_ytdlp,
+    }
+
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {
+            "latency": args.latency,
+            "rounds": args.rounds,
+            "workers": args.workers,
+            "fixtures": sorted(fixtures)
+        },
+        "methods": {
+            name: bench_method(run, sorted(fixtures), args.rounds, args.workers)
+            for name, run in methods.items()
+        }
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + "\n")
+        print(f"Results written to {args.output}")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
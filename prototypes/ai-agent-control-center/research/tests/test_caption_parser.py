@@ -0,0 +1,75 @@
+import pytest
+
+from youtube_transcript_extractor import iter_caption_cues
+
+
+def cues(text):
+    return list(iter_caption_cues(text.splitlines(keepends=True)))
+
+
+def test_vtt_blocks():
+    vtt = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:02.000\nA line\n\n"
+        "00:00:02.000 --> 00:00:03.000\nB line\n"
+    )
+    assert cues(vtt) == [(1.0, 2.0, "A line"), (2.0, 3.0, "B line")]
+
+
+@pytest.mark.parametrize("separator", [" \n", "\t\n", "  \n"])
+def test_whitespace_separator_ends_vtt_cue(separator):
+    vtt = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:02.000\nA line\n" + separator +
+        "00:00:02.000 --> 00:00:03.000\nB line\n"
+    )
+    assert cues(vtt) == [(1.0, 2.0, "A line"), (2.0, 3.0, "B line")]
+
+
+def test_whitespace_separator_ends_srt_cue():
+    srt = (
+        "1\r\n00:00:01,000 --> 00:00:02,000\r\nA line\r\n \r\n"
+        "2\r\n00:00:02,000 --> 00:00:03,500\r\nB line\r\n \r\n"
+        "3\r\n00:00:03,500 --> 00:00:04,000\r\nC line\r\n"
+    )
+    assert cues(srt) == [
+        (1.0, 2.0, "A line"), (2.0, 3.5, "B line"), (3.5, 4.0, "C line")
+    ]
+
+
+def test_timing_line_without_separator_starts_new_cue():
+    vtt = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:02.000\nA line\n"
+        "00:00:02.000 --> 00:00:03.000\nB line\n"
+    )
+    assert cues(vtt) == [(1.0, 2.0, "A line"), (2.0, 3.0, "B line")]
+
+
+def test_padded_cue_keeps_its_text():
+    # YouTube rolling cues start with a lone space when nothing is on screen
+    vtt = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:02.000 align:start position:0%\n \n"
+        "hello<00:00:01.500><c> world</c>\n\n"
+        "00:00:02.000 --> 00:00:02.010 align:start position:0%\nhello world\n \n\n"
+    )
+    assert cues(vtt) == [(1.0, 2.0, "hello world")]
+
+
+def test_digits_after_padding_are_text_unless_a_timing_follows():
+    vtt = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:02.000\nthe answer is\n \n42\n"
+    )
+    assert cues(vtt) == [(1.0, 2.0, "the answer is 42")]
+
+
+def test_rolling_repeats_and_entities():
+    vtt = (
+        "WEBVTT\nKind: captions\n\n"
+        "NOTE generated\nnot a caption\n\n"
+        "00:00:01.000 --> 00:00:02.000\nfish &amp; chips\n\n"
+        "00:00:02.000 --> 00:00:03.000\nfish &amp; chips\nare great\n\n"
+    )
+    assert cues(vtt) == [(1.0, 2.0, "fish & chips"), (2.0, 3.0, "are great")]
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from youtube_transcript_extractor import (
+    MemoryCache,
+    SQLiteCache,
+    TieredCache,
+    TranscriptExtractor,
+    freeze_result,
+    thaw_result,
+)
+
+RESULT = {
+    'success': True,
+    'video_id': 'dQw4w9WgXcQ',
+    'transcript': 'never gonna give you up',
+    'segments': [(0.0, 1.5, 'never gonna'), (1.5, 3.0, 'give you up')],
+    'available_transcripts': [
+        {'language': 'English', 'language_code': 'en', 'is_generated': False}
+    ],
+    'method': 'youtube-transcript-api',
+}
+
+
+def test_frozen_result_is_read_only():
+    frozen = freeze_result(RESULT)
+    assert frozen['from_cache'] is True
+    with pytest.raises(TypeError):
+        frozen['transcript'] = 'changed'
+    with pytest.raises(TypeError):
+        frozen['available_transcripts'][0]['language'] = 'changed'
+    assert isinstance(frozen['segments'], tuple)
+
+
+def test_freezing_copies_the_input():
+    result = json.loads(json.dumps(RESULT))
+    frozen = freeze_result(result)
+    result['available_transcripts'][0]['language'] = 'changed'
+    result['segments'].append((3.0, 4.0, 'extra'))
+    assert frozen['available_transcripts'][0]['language'] == 'English'
+    assert len(frozen['segments']) == 2
+
+
+def test_thawed_results_are_independent():
+    frozen = freeze_result(RESULT)
+    first = thaw_result(frozen)
+    first['transcript'] = 'changed'
+    first['available_transcripts'][0]['language'] = 'changed'
+    first['available_transcripts'].append({})
+
+    second = thaw_result(frozen)
+    assert second['transcript'] == RESULT['transcript']
+    assert second['available_transcripts'] == RESULT['available_transcripts']
+    assert isinstance(second['available_transcripts'], list)
+    assert isinstance(second['segments'], tuple)
+    json.dumps(second)
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'tiered'])
+def cache(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryCache()
+    disk = SQLiteCache(str(tmp_path / 'transcripts.db'))
+    return disk if request.param == 'sqlite' else TieredCache(MemoryCache(), disk)
+
+
+@pytest.fixture
+def extractor(cache, monkeypatch):
+    extractor = TranscriptExtractor(cache=cache)
+    fetches = []
+
+    def fake_primary(video_id, languages=None):
+        fetches.append(video_id)
+        return json.loads(json.dumps(RESULT))
+
+    monkeypatch.setattr(extractor, '_extract_with_youtube_transcript_api', fake_primary)
+    extractor.fetches = fetches
+    return extractor
+
+
+def test_caller_changes_never_reach_the_cache(extractor):
+    fresh = extractor.extract('dQw4w9WgXcQ', use_fallback=False)
+    assert fresh['from_cache'] is False
+    fresh['transcript'] = 'changed by caller'
+    fresh['available_transcripts'][0]['language'] = 'changed by caller'
+
+    hit = extractor.extract('dQw4w9WgXcQ', use_fallback=False)
+    assert hit['from_cache'] is True
+    assert hit['transcript'] == RESULT['transcript']
+    hit['available_transcripts'][0]['language'] = 'changed again'
+
+    again = extractor.extract('dQw4w9WgXcQ', use_fallback=False)
+    assert again['available_transcripts'] == RESULT['available_transcripts']
+    assert extractor.fetches == ['dQw4w9WgXcQ']
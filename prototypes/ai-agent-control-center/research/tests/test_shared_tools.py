@@ -0,0 +1,22 @@
+import sys
+
+import pytest
+
+import youtube_transcript_extractor
+from youtube_transcript_extractor import TranscriptExtractor
+
+
+def test_clean_text_falls_back_without_shared_normalizer(monkeypatch):
+    monkeypatch.setattr(youtube_transcript_extractor, "normalize_text", None)
+    assert TranscriptExtractor.clean_transcript_text(
+        "so  [Music] it “works” (inaudible)\n"
+    ) == 'so it "works"'
+
+
+def test_missing_tools_path_has_its_own_error(monkeypatch):
+    pytest.importorskip("youtube_transcript_api")
+    monkeypatch.setitem(sys.modules, "transcript_source", None)
+    result = TranscriptExtractor()._extract_with_youtube_transcript_api("dQw4w9WgXcQ")
+    assert not result["success"]
+    assert "youtube-processor tools not found" in result["error"]
+    assert "YOUTUBE_PROCESSOR_TOOLS" in result["error"]
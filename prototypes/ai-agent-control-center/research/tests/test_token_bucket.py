@@ -0,0 +1,40 @@
+import pytest
+
+from youtube_transcript_extractor import TokenBucket
+
+
+def test_unlimited_bucket_throttles_to_half_the_fallback_ceiling():
+    bucket = TokenBucket(rate=float('inf'), capacity=4)
+    bucket.throttled()
+    assert bucket.rate == TokenBucket.DEFAULT_THROTTLE_RATE / 2
+
+
+def test_unlimited_bucket_uses_configured_throttle_rate():
+    bucket = TokenBucket(rate=float('inf'), throttle_rate=10.0)
+    bucket.throttled()
+    assert bucket.rate == 5.0
+
+
+def test_repeat_throttle_during_pause_does_not_escalate():
+    bucket = TokenBucket(rate=float('inf'))
+    bucket.throttled()
+    rate = bucket.rate
+    bucket.throttled()
+    assert bucket.rate == rate
+
+
+def test_recovery_steps_by_a_tenth_of_the_ceiling():
+    bucket = TokenBucket(rate=float('inf'), throttle_rate=4.0)
+    bucket.throttled()
+    for _ in range(5):
+        bucket.succeeded()
+    assert bucket.rate == pytest.approx(4.0)
+
+
+def test_limited_bucket_recovers_to_its_rate_and_no_further():
+    bucket = TokenBucket(rate=2.0)
+    bucket.throttled()
+    assert bucket.rate == 1.0
+    for _ in range(20):
+        bucket.succeeded()
+    assert bucket.rate == 2.0
@@ -17,23 +17,550 @@ Usage:
         print(f"Error: {result['error']}")
 """
 
+import bisect
+import html
+import json
+import os
 import re
+import sqlite3
+import threading
 import time
-from typing import Dict, Optional, List
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Mapping, Optional, List, Tuple
+
+# Shared helpers from the youtube-processor skill. Optional: without
+# them the module still imports, cleans text with a built-in fallback,
+# and the youtube-transcript-api method reports the missing path.
+import sys
+TOOLS_DIR = os.path.abspath(os.environ.get(
+    "YOUTUBE_PROCESSOR_TOOLS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 "..", "..", "..", "skills", "youtube-processor", "tools")
+))
+if os.path.isdir(TOOLS_DIR) and TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+try:
+    from text_normalizer import normalize_text
+except ImportError:
+    normalize_text = None
+
+_WHITESPACE = re.compile(r'\s+')
+_ARTIFACTS = re.compile(r'\[[^\]]*\]|\([^)]*\)')
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by bulk extraction workers
+
+    Workers call acquire() before each request. When YouTube throttles,
+    throttled() halves the rate and pauses every worker; each clean
+    response nudges the rate back up towards the configured ceiling.
+    An unlimited bucket (rate inf) has no ceiling to halve, so its first
+    throttle drops it to half of throttle_rate instead.
+    """
+
+    DEFAULT_THROTTLE_RATE = 2.0
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        min_rate: float = 0.05,
+        base_pause: float = 2.0,
+        max_pause: float = 60.0,
+        throttle_rate: Optional[float] = None
+    ):
+        """
+        Args:
+            rate: Requests per second (float('inf') for no steady-state limit)
+            capacity: Burst size - requests allowed back to back
+            min_rate: Floor the rate never drops below when throttled
+            base_pause: First pause after a throttle, doubled while it persists
+            max_pause: Longest pause
+            throttle_rate: Requests per second an unlimited bucket falls
+                back to when first throttled (default DEFAULT_THROTTLE_RATE)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.min_rate = min_rate
+        self.base_pause = base_pause
+        self.max_pause = max_pause
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._pause = 0.0
+        if rate == float('inf'):
+            self.throttle_rate = throttle_rate or self.DEFAULT_THROTTLE_RATE
+        else:
+            self.throttle_rate = throttle_rate or rate
+        # Recovery step per clean response: a tenth of the ceiling
+        self._step = self.throttle_rate / 10
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be made"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                if elapsed > 0:
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                # _updated sits in the future while a throttle pause is active
+                wait = max(0.0, self._updated - now) + (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def throttled(self):
+        """YouTube pushed back: halve the rate and pause all workers"""
+        with self._lock:
+            now = time.monotonic()
+            if self._updated > now:
+                # Already paused - other workers' in-flight requests
+                # reporting the same throttle shouldn't escalate it
+                return
+            self._pause = min(self.max_pause, self._pause * 2 or self.base_pause)
+            if self.rate == float('inf'):
+                # inf / 2 is still inf - halve the fallback ceiling instead
+                self.rate = self.throttle_rate
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            self._updated = now + self._pause
+
+    def succeeded(self):
+        """A request went through: recover a tenth of the ceiling"""
+        with self._lock:
+            self._pause = 0.0
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self._step)
+
+
+# Caption files (yt-dlp fallback)
+
+CAPTION_TAG = re.compile(r'<[^>]*>')
+CUE_TIMING = re.compile(
+    r'(?:(\d+):)?(\d+):(\d+)[.,](\d+)\s*-->\s*(?:(\d+):)?(\d+):(\d+)[.,](\d+)'
+)
+
+# Block types in a WebVTT file that never contain caption text
+_VTT_SKIP_BLOCKS = ('WEBVTT', 'NOTE', 'STYLE', 'REGION')
+
+
+def _cue_times(timing_line: str) -> Tuple[float, float]:
+    """(start, end) seconds from a VTT or SRT timing line"""
+    match = CUE_TIMING.match(timing_line)
+    if not match:
+        return 0.0, 0.0
+    h1, m1, s1, f1, h2, m2, s2, f2 = match.groups()
+    return (
+        round(int(h1 or 0) * 3600 + int(m1) * 60 + int(s1) + int(f1) / 10 ** len(f1), 3),
+        round(int(h2 or 0) * 3600 + int(m2) * 60 + int(s2) + int(f2) / 10 ** len(f2), 3)
+    )
+
+
+def iter_caption_cues(lines: Iterable[str]) -> Iterator[Tuple[float, float, str]]:
+    """
+    Stream (start, end, text) cues from WebVTT or SRT lines in one pass
+
+    Auto-generated YouTube captions "roll": each cue repeats the line
+    already on screen above the new one, and short snapshot cues repeat
+    it again. Only text that differs from the last line emitted is kept,
+    so each spoken line comes out once, timed by the cue that introduced it.
+
+    Args:
+        lines: Any iterable of lines - an open file streams without
+            loading the whole file
+
+    Yields:
+        tuple: (start seconds, end seconds, text) for each cue with new text
+    """
+    last_line = None
+    timing = None
+    skipping = False
+    padded = False   # a whitespace-only line was seen since the last text
+    held = None      # digits after one - an SRT index or caption text
+    new_text = []
+
+    for line in lines:
+        if line == '\n' or line == '\r\n' or not line:
+            # Empty line ends a block
+            if new_text:
+                # Timings are only parsed for cues that add text -
+                # half of an auto-caption file is repeat-only cues
+                yield _cue_times(timing) + (' '.join(new_text),)
+                new_text = []
+            timing = None
+            skipping = False
+            padded = False
+            held = None
+            continue
+
+        line = line.strip()
+        if not line:
+            # YouTube pads cues with a lone space; some files also use
+            # one as the block separator. Either way the next timing
+            # line starts a new cue.
+            padded = True
+            continue
+
+        if '-->' in line:
+            # A timing line always opens a new cue, even without an
+            # empty line before it
+            if new_text:
+                yield _cue_times(timing) + (' '.join(new_text),)
+                new_text = []
+            timing = line
+            skipping = False
+            padded = False
+            held = None
+            continue
+
+        if skipping:
+            continue
+        if timing is None:
+            if line.startswith(_VTT_SKIP_BLOCKS):
+                skipping = True
+            # Otherwise a cue identifier (SRT index) - ignore it
+            continue
+
+        if padded:
+            if held is None and line.isdigit():
+                # Dropped if a timing line follows, kept as text otherwise
+                held = line
+                continue
+            if line.startswith(_VTT_SKIP_BLOCKS):
+                if new_text:
+                    yield _cue_times(timing) + (' '.join(new_text),)
+                    new_text = []
+                timing = None
+                skipping = True
+                padded = False
+                held = None
+                continue
+            padded = False
+            if held is not None:
+                if held != last_line:
+                    new_text.append(held)
+                    last_line = held
+                held = None
+
+        if line == last_line:
+            continue
+        if '<' in line:
+            line = CAPTION_TAG.sub('', line).strip()
+        if '&' in line:
+            line = html.unescape(line)
+        if line and line != last_line:
+            new_text.append(line)
+            last_line = line
+
+    if held is not None and held != last_line:
+        new_text.append(held)
+    if new_text:
+        yield _cue_times(timing) + (' '.join(new_text),)
+
+
+def read_caption_file(path: str) -> Tuple[str, List[Tuple[float, float, str]]]:
+    """
+    Parse a .vtt or .srt file into (text, cues)
+
+    Returns:
+        tuple: Transcript text and the (start, end, text) cues it was built from
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        cues = list(iter_caption_cues(f))
+    return ' '.join(cue[2] for cue in cues), cues
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    # Tuples of scalars/tuples (segments) are immutable already - shared
+    if isinstance(value, tuple) and value and isinstance(value[0], Mapping):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def freeze_result(result: Mapping) -> Mapping:
+    """
+    Deep read-only snapshot of a result, as held by the caches
+
+    Built once when the result is stored, with from_cache already set.
+    Nested lists become tuples and nested dicts read-only mappings, so
+    nothing a caller does to a result can reach the cached copy.
+    """
+    return _freeze({**result, 'from_cache': True})
+
+
+def thaw_result(frozen: Mapping) -> Dict:
+    """
+    Plain dict from a frozen result - what a cache hit returns
+
+    Only the small mappings are copied (the top level and entries like
+    available_transcripts); the transcript string and the segments tuple
+    are immutable and shared. The dict is JSON-serializable and safe to
+    change.
+    """
+    return _thaw(frozen)
+
+
+class MemoryCache:
+    """
+    In-process transcript cache with LRU and TTL eviction
+
+    Every cache backend has the same methods - get, set, delete and
+    clear - so TranscriptExtractor can take any of them.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 24 * 3600):
+        """
+        Args:
+            max_entries: Least recently used entries are dropped beyond this
+            ttl: Seconds an entry stays valid (None to keep until evicted)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # video_id -> (stored_at, frozen result)
+        self._lock = threading.Lock()
+
+    def get(self, video_id: str) -> Optional[Mapping]:
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+                del self._entries[video_id]
+                return None
+            self._entries.move_to_end(video_id)
+            return result
+
+    def set(self, video_id: str, result: Mapping, stored_at: Optional[float] = None):
+        with self._lock:
+            self._entries[video_id] = (stored_at or time.time(), result)
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, video_id: str):
+        with self._lock:
+            self._entries.pop(video_id, None)
+
+    def clear(self, older_than: Optional[float] = None):
+        """Drop everything, or only entries stored more than older_than seconds ago"""
+        with self._lock:
+            if older_than is None:
+                self._entries.clear()
+                return
+            cutoff = time.time() - older_than
+            for video_id in [k for k, (stored_at, _) in self._entries.items() if stored_at < cutoff]:
+                del self._entries[video_id]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """
+    On-disk transcript cache that survives restarts
+
+    One row per video holding the result as JSON. Entries past the TTL
+    are dropped on read; the oldest are evicted beyond max_entries.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: Optional[float] = 30 * 24 * 3600):
+        """
+        Args:
+            path: SQLite file, ~ expanded (parent directories are created)
+            max_entries: Oldest entries are dropped beyond this
+            ttl: Seconds an entry stays valid (None to keep until evicted)
+        """
+        self.path = path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            "video_id TEXT PRIMARY KEY, result TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, video_id: str) -> Optional[Mapping]:
+        return self.get_with_time(video_id)[0]
+
+    def get_with_time(self, video_id: str) -> Tuple[Optional[Mapping], float]:
+        """get() plus when the entry was stored, so TieredCache keeps its age"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, stored_at FROM transcripts WHERE video_id = ?", (video_id,)
+            ).fetchone()
+            if row is None:
+                return None, 0.0
+            if self.ttl is not None and time.time() - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM transcripts WHERE video_id = ?", (video_id,))
+                self._conn.commit()
+                return None, 0.0
+        return freeze_result(json.loads(row[0])), row[1]
+
+    def set(self, video_id: str, result: Mapping, stored_at: Optional[float] = None):
+        data = {k: v for k, v in thaw_result(result).items() if k != 'from_cache'}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts (video_id, result, stored_at) VALUES (?, ?, ?)",
+                (video_id, json.dumps(data), stored_at or time.time())
+            )
+            self._conn.execute(
+                "DELETE FROM transcripts WHERE video_id NOT IN ("
+                "SELECT video_id FROM transcripts ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def delete(self, video_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM transcripts WHERE video_id = ?", (video_id,))
+            self._conn.commit()
+
+    def clear(self, older_than: Optional[float] = None):
+        """Drop everything, or only entries stored more than older_than seconds ago"""
+        with self._lock:
+            if older_than is None:
+                self._conn.execute("DELETE FROM transcripts")
+            else:
+                self._conn.execute(
+                    "DELETE FROM transcripts WHERE stored_at < ?", (time.time() - older_than,)
+                )
+            self._conn.commit()
+
+
+class TieredCache:
+    """Memory cache in front of an on-disk cache"""
+
+    def __init__(self, memory: MemoryCache, disk: SQLiteCache):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, video_id: str) -> Optional[Mapping]:
+        result = self.memory.get(video_id)
+        if result is None:
+            result, stored_at = self.disk.get_with_time(video_id)
+            if result is not None:
+                self.memory.set(video_id, result, stored_at=stored_at)
+        return result
+
+    def set(self, video_id: str, result: Mapping, stored_at: Optional[float] = None):
+        self.memory.set(video_id, result, stored_at=stored_at)
+        self.disk.set(video_id, result, stored_at=stored_at)
+
+    def delete(self, video_id: str):
+        self.memory.delete(video_id)
+        self.disk.delete(video_id)
+
+    def clear(self, older_than: Optional[float] = None):
+        self.memory.clear(older_than)
+        self.disk.clear(older_than)
+
+
+class LatencyHistogram:
+    """
+    Response times for one transcript source, in log-spaced buckets
+
+    Fixed memory however many requests it sees. quantile() answers with
+    the upper edge of the bucket holding that quantile - within 25% of
+    the true value, which is plenty for picking a hedge deadline.
+    """
+
+    # 10ms to ~2 minutes, each bucket 1.25x wider than the last
+    BOUNDS = [0.01 * 1.25 ** i for i in range(43)]
+
+    def __init__(self):
+        self._counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        index = bisect.bisect_left(self.BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Seconds below which a fraction q of responses finished (None if empty)"""
+        with self._lock:
+            if not self.count:
+                return None
+            target = q * self.count
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= target:
+                    return self.BOUNDS[min(index, len(self.BOUNDS) - 1)]
+        return self.BOUNDS[-1]
 
 
 class TranscriptExtractor:
     """Main class for extracting YouTube transcripts"""
 
-    def __init__(self, cache_enabled: bool = True):
+    def __init__(
+        self,
+        cache_enabled: bool = True,
+        cache=None,
+        cache_path: Optional[str] = None,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_default_delay: float = 3.0,
+        hedge_min_samples: int = 20
+    ):
         """
         Initialize the extractor
 
         Args:
             cache_enabled: Whether to cache transcripts (useful for repeated requests)
+            cache: Cache backend (MemoryCache, SQLiteCache, TieredCache or
+                anything with the same methods); defaults to a MemoryCache
+            cache_path: Also keep transcripts in this SQLite file, so they
+                survive restarts (ignored if cache is given)
+            hedge: Start yt-dlp alongside youtube-transcript-api when the
+                latter is slower than usual, and take whichever answers first
+            hedge_quantile: Latency quantile of youtube-transcript-api used
+                as the hedge deadline (default p95)
+            hedge_default_delay: Deadline in seconds until enough latencies
+                have been recorded
+            hedge_min_samples: Latencies needed before the quantile is used
         """
         self.cache_enabled = cache_enabled
-        self._cache = {}
+        if cache is None:
+            cache = MemoryCache()
+            if cache_path:
+                cache = TieredCache(cache, SQLiteCache(cache_path))
+        self._cache = cache
+
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_default_delay = hedge_default_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.latency = {
+            'youtube-transcript-api': LatencyHistogram(),
+            'yt-dlp': LatencyHistogram()
+        }
+        self._hedge_pool = None
+        self._hedge_pool_lock = threading.Lock()
 
     @staticmethod
     def extract_video_id(url_or_id: str) -> str:
@@ -84,18 +611,22 @@ class TranscriptExtractor:
         Returns:
             str: Cleaned text suitable for AI processing
         """
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        # Remove common transcript artifacts
-        text = re.sub(r'\[.*?\]', '', text)  # [Music], [Applause], etc.
-        text = re.sub(r'\(.*?\)', '', text)  # (inaudible), etc.
+        # Whitespace, [Music]/(inaudible) artifacts and curly quotes,
+        # via the youtube-processor skill's shared normalizer
+        if normalize_text is not None:
+            return normalize_text(text)
+        text = _ARTIFACTS.sub(' ', text)
+        for curly, straight in (('\u201c', '"'), ('\u201d', '"'), ('\u2018', "'"), ('\u2019', "'")):
+            text = text.replace(curly, straight)
+        return _WHITESPACE.sub(' ', text).strip()
 
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-
-        return text.strip()
+    @staticmethod
+    def _is_throttled(error: Exception) -> bool:
+        """Whether an exception means YouTube is rate limiting us"""
+        if type(error).__name__ in ('RequestBlocked', 'IpBlocked', 'TooManyRequests'):
+            return True
+        message = str(error)
+        return '429' in message or 'Too Many Requests' in message
 
     def _extract_with_youtube_transcript_api(
         self,
@@ -113,7 +644,6 @@ class TranscriptExtractor:
             dict: Result with success status and transcript or error
         """
         try:
-            from youtube_transcript_api import YouTubeTranscriptApi
             from youtube_transcript_api._errors import (
                 TranscriptsDisabled,
                 NoTranscriptFound,
@@ -125,43 +655,44 @@ class TranscriptExtractor:
                 'error': 'youtube-transcript-api not installed. Install with: pip install youtube-transcript-api',
                 'method': 'youtube-transcript-api'
             }
+        try:
+            from transcript_source import describe_tracks, fetch_transcript_track
+        except ImportError:
+            return {
+                'success': False,
+                'error': (
+                    f'youtube-processor tools not found at {TOOLS_DIR}. '
+                    'Set YOUTUBE_PROCESSOR_TOOLS to skills/youtube-processor/tools'
+                ),
+                'method': 'youtube-transcript-api'
+            }
 
         if languages is None:
             languages = ['en', 'en-US', 'en-GB']
 
         try:
-            # Fetch transcript
-            transcript_list = YouTubeTranscriptApi.get_transcript(
+            # One list call picks the track and describes the others;
+            # one fetch downloads it
+            track, segments, transcript_list = fetch_transcript_track(
                 video_id,
-                languages=languages
+                languages=languages,
+                any_language=False
             )
 
             # Combine segments
-            full_text = ' '.join([segment['text'] for segment in transcript_list])
+            full_text = ' '.join([segment.text for segment in segments])
 
             # Clean text
             full_text = self.clean_transcript_text(full_text)
 
-            # Get metadata about available transcripts
-            available_transcripts = []
-            try:
-                transcript_metadata = YouTubeTranscriptApi.list_transcripts(video_id)
-                for t in transcript_metadata:
-                    available_transcripts.append({
-                        'language': t.language,
-                        'language_code': t.language_code,
-                        'is_generated': t.is_generated
-                    })
-            except:
-                pass  # Metadata is nice to have but not critical
-
             return {
                 'success': True,
                 'transcript': full_text,
                 'video_id': video_id,
                 'method': 'youtube-transcript-api',
-                'segment_count': len(transcript_list),
-                'available_transcripts': available_transcripts,
+                'language_code': track.language_code,
+                'segment_count': len(segments),
+                'available_transcripts': describe_tracks(transcript_list),
                 'char_count': len(full_text),
                 'word_count': len(full_text.split())
             }
@@ -192,7 +723,8 @@ class TranscriptExtractor:
                 'success': False,
                 'error': f'Unexpected error: {str(e)}',
                 'video_id': video_id,
-                'method': 'youtube-transcript-api'
+                'method': 'youtube-transcript-api',
+                'throttled': self._is_throttled(e)
             }
 
     def _extract_with_ytdlp(
@@ -254,23 +786,9 @@ class TranscriptExtractor:
                             'method': 'yt-dlp'
                         }
 
-                    # Read and parse VTT file
-                    with open(subtitle_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Parse VTT to clean text
-                    lines = content.split('\n')
-                    text_lines = []
-
-                    for line in lines:
-                        # Skip timestamps, empty lines, and headers
-                        if '-->' not in line and line.strip() and not line.startswith('WEBVTT'):
-                            # Remove VTT formatting tags
-                            clean_line = re.sub(r'<[^>]+>', '', line)
-                            if clean_line.strip():
-                                text_lines.append(clean_line.strip())
-
-                    full_text = ' '.join(text_lines)
+                    # Stream the VTT file, keeping cue timings and
+                    # dropping rolling-caption repeats
+                    full_text, cues = read_caption_file(subtitle_file)
                     full_text = self.clean_transcript_text(full_text)
 
                     return {
@@ -280,6 +798,8 @@ class TranscriptExtractor:
                         'method': 'yt-dlp',
                         'title': title,
                         'duration': duration,
+                        'segment_count': len(cues),
+                        'segments': cues,
                         'char_count': len(full_text),
                         'word_count': len(full_text.split())
                     }
@@ -309,7 +829,9 @@ class TranscriptExtractor:
             rate_limit_delay: Seconds to wait before making request (for bulk operations)
 
         Returns:
-            dict: Result containing transcript and metadata
+            dict: Result containing transcript and metadata. Cache hits
+            (from_cache is True) are a fresh dict too, with segments
+            as a tuple
 
         Example:
             >>> extractor = TranscriptExtractor()
@@ -330,42 +852,114 @@ class TranscriptExtractor:
                 'error': str(e)
             }
 
-        # Check cache
-        if self.cache_enabled and video_id in self._cache:
-            cached_result = self._cache[video_id].copy()
-            cached_result['from_cache'] = True
-            return cached_result
+        # Check cache - the cached copy stays frozen; callers get a dict
+        if self.cache_enabled:
+            cached_result = self._cache.get(video_id)
+            if cached_result is not None:
+                return thaw_result(cached_result)
 
-        # Try primary method: youtube-transcript-api
-        result = self._extract_with_youtube_transcript_api(video_id, languages)
+        if use_fallback and self.hedge:
+            result = self._extract_hedged(video_id, languages)
+        else:
+            # Try primary method: youtube-transcript-api
+            result = self._timed_primary(video_id, languages)
 
-        # If failed and fallback enabled, try yt-dlp
-        if not result['success'] and use_fallback:
-            result = self._extract_with_ytdlp(video_id)
+            # If failed and fallback enabled, try yt-dlp
+            if not result['success'] and use_fallback:
+                result = self._merge_failure(result, self._timed_fallback(video_id))
 
         # Cache successful results
         if self.cache_enabled and result['success']:
-            self._cache[video_id] = result.copy()
+            self._cache.set(video_id, freeze_result(result))
 
         result['from_cache'] = False
         return result
 
+    def _timed_primary(self, video_id: str, languages: Optional[List[str]]) -> Dict:
+        started = time.perf_counter()
+        try:
+            return self._extract_with_youtube_transcript_api(video_id, languages)
+        finally:
+            self.latency['youtube-transcript-api'].record(time.perf_counter() - started)
+
+    def _timed_fallback(self, video_id: str) -> Dict:
+        started = time.perf_counter()
+        try:
+            return self._extract_with_ytdlp(video_id)
+        finally:
+            self.latency['yt-dlp'].record(time.perf_counter() - started)
+
+    @staticmethod
+    def _merge_failure(primary: Dict, fallback: Dict) -> Dict:
+        """The fallback's result, still flagged if the primary was throttled"""
+        if not fallback['success'] and primary.get('throttled'):
+            fallback['throttled'] = True
+        return fallback
+
+    def hedge_deadline(self) -> float:
+        """Seconds to give youtube-transcript-api before starting yt-dlp too"""
+        histogram = self.latency['youtube-transcript-api']
+        if histogram.count < self.hedge_min_samples:
+            return self.hedge_default_delay
+        return histogram.quantile(self.hedge_quantile)
+
+    def _extract_hedged(self, video_id: str, languages: Optional[List[str]]) -> Dict:
+        """
+        Race the two sources: yt-dlp starts once youtube-transcript-api
+        misses its deadline (or fails), and the first success wins.
+        The slower request is left to finish in the background.
+        """
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=16, thread_name_prefix='transcript-hedge'
+                )
+        pool = self._hedge_pool
+
+        primary = pool.submit(self._timed_primary, video_id, languages)
+        wait([primary], timeout=self.hedge_deadline())
+        if primary.done() and primary.result()['success']:
+            return primary.result()
+
+        fallback = pool.submit(self._timed_fallback, video_id)
+        hedged = not primary.done()
+        pending = {primary, fallback}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.result()['success']:
+                    result = future.result()
+                    result['hedged'] = hedged
+                    return result
+
+        return self._merge_failure(primary.result(), fallback.result())
+
     def bulk_extract(
         self,
         video_urls: List[str],
         rate_limit_delay: float = 1.0,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_workers: int = 4,
+        max_retries: int = 3
     ) -> List[Dict]:
         """
         Extract transcripts from multiple videos
 
+        Requests run on a thread pool behind a shared token bucket, so
+        rate_limit_delay is the average gap between requests across all
+        workers rather than a sleep before each one - slow responses
+        overlap instead of queueing. Throttled requests back the whole
+        pool off and are retried.
+
         Args:
             video_urls: List of YouTube URLs or video IDs
-            rate_limit_delay: Delay between requests (default: 1 second)
+            rate_limit_delay: Average seconds between requests (default: 1 second, 0 for no limit)
             progress_callback: Optional callback function(current, total)
+            max_workers: Requests in flight at once (1 for serial)
+            max_retries: Retries per video when YouTube throttles
 
         Returns:
-            list: List of result dictionaries
+            list: List of result dictionaries, in the same order as video_urls
 
         Example:
             >>> extractor = TranscriptExtractor()
@@ -374,20 +968,120 @@ class TranscriptExtractor:
             >>> successful = [r for r in results if r['success']]
             >>> print(f"Extracted {len(successful)}/{len(urls)} transcripts")
         """
-        results = []
+        results = [None] * len(video_urls)
+
+        for index, result in self.iter_bulk_extract(
+            video_urls,
+            rate_limit_delay=rate_limit_delay,
+            progress_callback=progress_callback,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            ordered=False
+        ):
+            results[index] = result
+
+        return results
+
+    def iter_bulk_extract(
+        self,
+        video_urls: List[str],
+        rate_limit_delay: float = 1.0,
+        progress_callback: Optional[callable] = None,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        ordered: bool = False
+    ) -> Iterator[Tuple[int, Dict]]:
+        """
+        Like bulk_extract, but yield (index, result) pairs as they finish
 
-        for i, url in enumerate(video_urls):
-            if progress_callback:
-                progress_callback(i + 1, len(video_urls))
+        Args:
+            video_urls: List of YouTube URLs or video IDs
+            rate_limit_delay: Average seconds between requests (0 for no limit)
+            progress_callback: Optional callback function(current, total),
+                called from this thread once per finished video
+            max_workers: Requests in flight at once
+            max_retries: Retries per video when YouTube throttles
+            ordered: Yield in input order instead of completion order
 
-            result = self.extract(url, rate_limit_delay=rate_limit_delay)
-            results.append(result)
+        Yields:
+            tuple: (index into video_urls, result dictionary)
 
-        return results
+        Example:
+            >>> for index, result in extractor.iter_bulk_extract(urls):
+            ...     print(urls[index], result['success'])
+        """
+        total = len(video_urls)
+        bucket = TokenBucket(
+            rate=1.0 / rate_limit_delay if rate_limit_delay > 0 else float('inf'),
+            capacity=max_workers
+        )
+        buffered = {}
+        next_index = 0
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                pool.submit(self._extract_rate_limited, url, bucket, max_retries): index
+                for index, url in enumerate(video_urls)
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    index = futures[future]
+                    if progress_callback:
+                        progress_callback(done, total)
+
+                    if not ordered:
+                        yield index, future.result()
+                        continue
+
+                    buffered[index] = future.result()
+                    while next_index in buffered:
+                        yield next_index, buffered.pop(next_index)
+                        next_index += 1
+            finally:
+                # Caller stopped early - don't start the rest
+                for future in futures:
+                    future.cancel()
+
+    def _extract_rate_limited(
+        self,
+        url_or_id: str,
+        bucket: TokenBucket,
+        max_retries: int
+    ) -> Dict:
+        """One bulk extraction: wait for a token, retry while throttled"""
+        # Only requests that reach the network take a token
+        try:
+            video_id = self.extract_video_id(url_or_id)
+        except ValueError:
+            return self.extract(url_or_id)
+        if self.cache_enabled:
+            cached_result = self._cache.get(video_id)
+            if cached_result is not None:
+                return thaw_result(cached_result)
+
+        for attempt in range(max_retries + 1):
+            bucket.acquire()
+            result = self.extract(url_or_id)
+            if not result.get('throttled'):
+                bucket.succeeded()
+                return result
+            bucket.throttled()
+        return result
+
+    def clear_cache(self, video_id: Optional[str] = None, older_than: Optional[float] = None):
+        """
+        Invalidate cached transcripts
 
-    def clear_cache(self):
-        """Clear the transcript cache"""
-        self._cache = {}
+        Args:
+            video_id: Only drop this video (URL or ID)
+            older_than: Only drop entries cached more than this many seconds ago
+
+        With neither, the whole cache is cleared.
+        """
+        if video_id is not None:
+            self._cache.delete(self.extract_video_id(video_id))
+        else:
+            self._cache.clear(older_than)
 
 
 # Convenience function for simple use cases
@@ -445,7 +1139,7 @@ if __name__ == '__main__':
         print(f"\n💾 Saved to: {output_file}")
 
         # Save metadata as JSON
-        metadata = {k: v for k, v in result.items() if k != 'transcript'}
+        metadata = {k: v for k, v in result.items() if k not in ('transcript', 'segments')}
         metadata_file = f"{result['video_id']}_metadata.json"
         with open(metadata_file, 'w', encoding='utf-8') as f:
             json.dump(metadata, f, indent=2)
@@ -5,18 +5,39 @@ Direct pipeline: YouTube URL -> Transcript -> Claude Summary -> Obsidian-ready o
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, HttpUrl
-import anthropic
+import asyncio
+import json
 import os
-from youtube_transcript_api import YouTubeTranscriptApi
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
     VideoUnavailable
 )
-import re
+import sys
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+# Shared helpers from the youtube-processor skill (copied to /app/tools in Docker)
+sys.path.insert(0, os.environ.get(
+    "YOUTUBE_PROCESSOR_TOOLS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 "..", "..", "..", "skills", "youtube-processor", "tools")
+))
+
+from claude_client import call_with_retries, get_client, stream_with_retries
+from note_template import NoteTemplate
+from single_flight import single_flight, single_flight_stats
+from transcript_source import fetch_transcript_track
+from vault_index import vault_index
+from video_url import extract_video_id
 
 app = FastAPI(title="YouTube Processor", version="1.0")
 
@@ -34,6 +55,8 @@ class YouTubeRequest(BaseModel):
     summary_type: Optional[str] = "detailed"  # "brief", "detailed", "bullets"
     save_to_obsidian: Optional[bool] = False
     obsidian_vault_path: Optional[str] = None
+    # False leaves the transcript out of markdown_output (saved notes keep it)
+    include_transcript: Optional[bool] = True
 
 class ProcessingResult(BaseModel):
     success: bool
@@ -45,49 +68,16 @@ class ProcessingResult(BaseModel):
     saved_to: Optional[str] = None
 
 
-def extract_video_id(url: str) -> str:
-    """
-    Extract YouTube video ID from various URL formats
-    Handles: youtube.com/watch?v=ID, youtu.be/ID, youtube.com/embed/ID
-    """
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'youtu\.be\/([0-9A-Za-z_-]{11})',
-        r'embed\/([0-9A-Za-z_-]{11})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-
-    raise ValueError("Could not extract video ID from URL")
-
-
 def get_transcript(video_id: str) -> tuple[str, str]:
     """
     Fetch transcript from YouTube video
     Returns: (transcript_text, language)
     """
     try:
-        # New API is instance-based (youtube-transcript-api >= 1.0)
-        ytt_api = YouTubeTranscriptApi()
-
-        # Try to fetch English transcript directly
-        try:
-            transcript_data = ytt_api.fetch(video_id, languages=['en'])
-            full_text = " ".join([item.text for item in transcript_data])
-            return full_text, 'en'
-        except:
-            # Fall back to listing and finding any available
-            transcript_list = ytt_api.list(video_id)
-            for transcript in transcript_list:
-                transcript_data = transcript.fetch()
-                full_text = " ".join([item.text for item in transcript_data])
-                return full_text, transcript.language_code
-
-        raise NoTranscriptFound(video_id)
-
+        # English if there is one, otherwise any track - one list, one fetch
+        track, transcript_data, _ = fetch_transcript_track(video_id, languages=['en'])
+        full_text = " ".join([item.text for item in transcript_data])
+        return full_text, track.language_code
     except TranscriptsDisabled:
         raise HTTPException(
             status_code=400,
@@ -110,38 +100,44 @@ def get_transcript(video_id: str) -> tuple[str, str]:
         )
 
 
-def summarize_with_claude(transcript: str, summary_type: str = "detailed") -> str:
-    """
-    Send transcript to Claude for summarization
-    """
-    client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-
-    # Different prompt styles based on summary type
-    prompts = {
-        "brief": "Provide a concise 2-3 sentence summary of this video transcript.",
-        "detailed": """Analyze this video transcript and provide:
+SUMMARY_PROMPTS = {
+    "brief": "Provide a concise 2-3 sentence summary of this video transcript.",
+    "detailed": """Analyze this video transcript and provide:
 1. A headline summary (1 sentence)
 2. Key points (3-5 bullets)
 3. Main takeaways
 4. Any action items or recommendations mentioned
 
 Format in clean markdown.""",
-        "bullets": "Extract the key points from this video transcript as a bulleted list. Focus on actionable insights and main ideas."
-    }
+    "bullets": "Extract the key points from this video transcript as a bulleted list. Focus on actionable insights and main ideas."
+}
+
+
+CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+SUMMARY_MAX_TOKENS = 2000
+
 
-    prompt = prompts.get(summary_type, prompts["detailed"])
+def summary_messages(transcript: str, summary_type: str) -> List[Dict[str, str]]:
+    """The user message asking for one summary type"""
+    prompt = SUMMARY_PROMPTS.get(summary_type, SUMMARY_PROMPTS["detailed"])
+    return [{"role": "user", "content": f"{prompt}\n\nTranscript:\n{transcript}"}]
+
+
+def summarize_with_claude(transcript: str, summary_type: str = "detailed") -> str:
+    """
+    Send transcript to Claude for summarization
 
+    Goes through the skill's shared claude_client: one pooled client per
+    process, a process-wide cap on requests in flight, and configurable
+    429/529 backoff (ANTHROPIC_MAX_CONCURRENCY, ANTHROPIC_MAX_RETRIES, ...).
+    """
     try:
-        message = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=2000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"{prompt}\n\nTranscript:\n{transcript}"
-                }
-            ]
-        )
+        client = get_client()
+        message = call_with_retries(lambda: client.messages.create(
+            model=CLAUDE_MODEL,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            messages=summary_messages(transcript, summary_type)
+        ))
 
         return message.content[0].text
 
@@ -152,13 +148,62 @@ Format in clean markdown.""",
         )
 
 
-def format_for_obsidian(video_id: str, url: str, summary: str, transcript: str) -> str:
-    """
-    Format output as Obsidian-compatible markdown
+async def stream_summary_with_claude(
+    transcript: str,
+    summary_type: str = "detailed"
+) -> AsyncIterator[str]:
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    Stream a summary from Claude, yielding text deltas as they arrive
 
-    markdown = f"""---
+    claude_client's stream (shared concurrency cap, retries before the
+    first delta) is synchronous, so it runs on a worker thread and hands
+    deltas over through a queue. If the caller stops early - the SSE
+    client went away - the thread stops at the next delta and closes the
+    stream, which frees its concurrency slot.
+    """
+    client = get_client()
+    messages = summary_messages(transcript, summary_type)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    finished = object()
+
+    def hand_over(item) -> None:
+        if not stop.is_set():
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    def pump() -> None:
+        try:
+            with closing(stream_with_retries(lambda: client.messages.stream(
+                model=CLAUDE_MODEL,
+                max_tokens=SUMMARY_MAX_TOKENS,
+                messages=messages
+            ))) as deltas:
+                for text in deltas:
+                    if stop.is_set():
+                        return
+                    hand_over(text)
+        except Exception as e:
+            hand_over(e)
+        finally:
+            hand_over(finished)
+
+    threading.Thread(target=pump, name="claude-stream", daemon=True).start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is finished:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+# Compiled once; rendered as chunks so a saved note streams to disk
+# without first copying the whole transcript into one markdown string
+_NOTE_HEAD = """---
 source: YouTube
 video_id: {video_id}
 url: {url}
@@ -176,24 +221,54 @@ tags: [youtube, video-notes]
 {summary}
 
 ---
-
+"""
+_NOTE_TRANSCRIPT = """
 ## Full Transcript
 
 {transcript}
 
 ---
-
+"""
+_NOTE_FOOT = """
 **Generated by**: YouTube Processor API
 **Model**: Claude Sonnet 4.5
 """
+NOTE_TEMPLATE = NoteTemplate(_NOTE_HEAD + _NOTE_TRANSCRIPT + _NOTE_FOOT)
+NOTE_SUMMARY_TEMPLATE = NoteTemplate(_NOTE_HEAD + _NOTE_FOOT)
 
-    return markdown
+
+def note_fields(video_id: str, url: str, summary: str, transcript: Optional[str] = None) -> dict:
+    """Template values for a note; leave transcript out for the summary-only one"""
+    fields = {
+        "video_id": video_id,
+        "url": url,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "summary": summary
+    }
+    if transcript is not None:
+        fields["transcript"] = transcript
+    return fields
 
 
-def save_to_obsidian_vault(content: str, vault_path: str, video_id: str) -> str:
+def format_for_obsidian(video_id: str, url: str, summary: str, transcript: Optional[str]) -> str:
     """
-    Save markdown to Obsidian vault
-    Returns: path where file was saved
+    Format output as Obsidian-compatible markdown
+    (transcript=None leaves out the Full Transcript section)
+    """
+    template = NOTE_TEMPLATE if transcript is not None else NOTE_SUMMARY_TEMPLATE
+    return template.render(**note_fields(video_id, url, summary, transcript))
+
+
+def save_to_obsidian_vault(
+    content: Union[str, Iterable[Tuple[str, bool]]],
+    vault_path: str,
+    video_id: str
+) -> str:
+    """
+    Save markdown to Obsidian vault, updating the video's existing note
+    (via the vault index) rather than adding another one. `content` may be
+    NOTE_TEMPLATE.bind(...) to stream the note to disk
+    Returns: path of the video's note
     """
     if not vault_path or not os.path.exists(vault_path):
         raise HTTPException(
@@ -204,11 +279,9 @@ def save_to_obsidian_vault(content: str, vault_path: str, video_id: str) -> str:
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     filename = f"YT-{video_id}-{timestamp}.md"
-    filepath = os.path.join(vault_path, filename)
 
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        filepath, _ = vault_index(vault_path).write_note(video_id, content, filename)
         return filepath
     except Exception as e:
         raise HTTPException(
@@ -217,6 +290,208 @@ def save_to_obsidian_vault(content: str, vault_path: str, video_id: str) -> str:
         )
 
 
+def run_pipeline(
+    url: str,
+    summary_type: Optional[str] = "detailed",
+    save_to_obsidian: Optional[bool] = False,
+    obsidian_vault_path: Optional[str] = None,
+    include_transcript: Optional[bool] = True
+) -> ProcessingResult:
+    """
+    Fetch -> summarize -> format -> save, shared by /process and the job workers
+
+    Raises:
+        HTTPException: For transcript, Claude or vault errors
+    """
+    # Step 1: Extract video ID
+    video_id = extract_video_id(url)
+
+    # Step 2: Get transcript (shared with concurrent requests for this video)
+    transcript, language = single_flight("transcripts").do(
+        video_id, lambda: get_transcript(video_id)
+    )
+
+    # Step 3: Summarize with Claude
+    summary = single_flight("summaries").do(
+        (video_id, summary_type), lambda: summarize_with_claude(transcript, summary_type)
+    )
+
+    # Step 4: Format for Obsidian
+    markdown_output = format_for_obsidian(
+        video_id=video_id,
+        url=url,
+        summary=summary,
+        transcript=transcript if include_transcript else None
+    )
+
+    # Step 5: Optionally save to Obsidian vault, streamed from the template
+    saved_path = None
+    if save_to_obsidian and obsidian_vault_path:
+        saved_path = save_to_obsidian_vault(
+            NOTE_TEMPLATE.bind(**note_fields(video_id, url, summary, transcript)),
+            obsidian_vault_path,
+            video_id
+        )
+
+    return ProcessingResult(
+        success=True,
+        video_id=video_id,
+        summary=summary,
+        markdown_output=markdown_output,
+        saved_to=saved_path
+    )
+
+
+# Background jobs: POST /jobs returns straight away and the pipeline runs
+# on a worker pool, so iOS Shortcuts poll GET /jobs/{id} instead of holding
+# a request open for the whole video. Jobs live in SQLite, so a restart
+# picks unfinished ones back up.
+JOB_DB_PATH = os.environ.get(
+    "JOB_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "jobs.db")
+)
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "4"))
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class JobStore:
+    """SQLite job table shared by the request handlers and worker threads"""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                coalesce_key TEXT NOT NULL,
+                video_id TEXT NOT NULL,
+                request TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_in_flight ON jobs (coalesce_key, status)"
+        )
+        self._conn.commit()
+
+    def submit(self, video_id: str, request: Dict) -> Tuple[str, bool]:
+        """
+        Create a queued job, or join the in-flight one for the same work
+
+        Returns:
+            (job_id, coalesced) - coalesced is True if an existing job was reused
+        """
+        key = json.dumps([video_id, request["summary_type"], request["save_to_obsidian"],
+                          request["obsidian_vault_path"], request["include_transcript"]])
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM jobs WHERE coalesce_key = ? AND status IN (?, ?)",
+                (key, JOB_QUEUED, JOB_RUNNING)
+            ).fetchone()
+            if row is not None:
+                return row["id"], True
+
+            job_id = uuid.uuid4().hex
+            now = time.time()
+            self._conn.execute(
+                "INSERT INTO jobs (id, coalesce_key, video_id, request, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, key, video_id, json.dumps(request), JOB_QUEUED, now, now)
+            )
+            self._conn.commit()
+            return job_id, False
+
+    def update(self, job_id: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id)
+            )
+            self._conn.commit()
+
+    def get(self, job_id: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def unfinished(self) -> List[str]:
+        """IDs of jobs a previous process queued or started but never finished"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (JOB_QUEUED, JOB_RUNNING)
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+
+_job_store: Optional[JobStore] = None
+_job_pool: Optional[ThreadPoolExecutor] = None
+_job_lock = threading.Lock()
+
+
+def get_job_queue() -> Tuple[JobStore, ThreadPoolExecutor]:
+    """Shared job store and worker pool, created on first use"""
+    global _job_store, _job_pool
+    with _job_lock:
+        if _job_store is None:
+            _job_store = JobStore(JOB_DB_PATH)
+            _job_pool = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+            # Resume whatever the last process left behind
+            for job_id in _job_store.unfinished():
+                _job_pool.submit(run_job, job_id)
+    return _job_store, _job_pool
+
+
+def run_job(job_id: str):
+    """Worker: run one job's pipeline and record the outcome"""
+    store, _ = get_job_queue()
+    row = store.get(job_id)
+    if row is None:
+        return
+    request = json.loads(row["request"])
+    store.update(job_id, JOB_RUNNING)
+    try:
+        result = run_pipeline(**request)
+        store.update(job_id, JOB_DONE, result=result.model_dump())
+    except HTTPException as e:
+        store.update(job_id, JOB_FAILED, error=str(e.detail))
+    except Exception as e:
+        store.update(job_id, JOB_FAILED, error=str(e))
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str  # "queued", "running", "done", "failed"
+    video_id: str
+    coalesced: bool = False
+    created_at: str
+    updated_at: str
+    result: Optional[ProcessingResult] = None
+    error: Optional[str] = None
+
+
+def job_status(row: sqlite3.Row, coalesced: bool = False) -> JobStatus:
+    return JobStatus(
+        job_id=row["id"],
+        status=row["status"],
+        video_id=row["video_id"],
+        coalesced=coalesced,
+        created_at=datetime.fromtimestamp(row["created_at"]).isoformat(),
+        updated_at=datetime.fromtimestamp(row["updated_at"]).isoformat(),
+        result=ProcessingResult(**json.loads(row["result"])) if row["result"] else None,
+        error=row["error"]
+    )
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -226,6 +501,8 @@ async def root():
         "version": "1.0",
         "endpoints": {
             "process": "/process (POST)",
+            "stream": "/process/stream?url=... (GET, Server-Sent Events)",
+            "jobs": "/jobs (POST) -> job_id, then /jobs/{job_id} (GET) to poll",
             "health": "/ (GET)"
         }
     }
@@ -245,40 +522,15 @@ async def process_youtube_video(request: YouTubeRequest):
     """
 
     try:
-        # Step 1: Extract video ID
-        video_id = extract_video_id(str(request.url))
-
-        # Step 2: Get transcript
-        transcript, language = get_transcript(video_id)
-
-        # Step 3: Summarize with Claude
-        summary = summarize_with_claude(transcript, request.summary_type)
-
-        # Step 4: Format for Obsidian
-        markdown_output = format_for_obsidian(
-            video_id=video_id,
-            url=str(request.url),
-            summary=summary,
-            transcript=transcript
+        # Blocking pipeline runs off the event loop
+        return await asyncio.to_thread(
+            run_pipeline,
+            str(request.url),
+            request.summary_type,
+            request.save_to_obsidian,
+            request.obsidian_vault_path,
+            request.include_transcript
         )
-
-        # Step 5: Optionally save to Obsidian vault
-        saved_path = None
-        if request.save_to_obsidian and request.obsidian_vault_path:
-            saved_path = save_to_obsidian_vault(
-                markdown_output,
-                request.obsidian_vault_path,
-                video_id
-            )
-
-        return ProcessingResult(
-            success=True,
-            video_id=video_id,
-            summary=summary,
-            markdown_output=markdown_output,
-            saved_to=saved_path
-        )
-
     except HTTPException:
         raise
     except Exception as e:
@@ -289,6 +541,100 @@ async def process_youtube_video(request: YouTubeRequest):
         )
 
 
+@app.post("/jobs", response_model=JobStatus, status_code=202)
+async def submit_job(request: YouTubeRequest):
+    """
+    Queue a video for background processing and return its job ID at once
+
+    Submitting the same video (and options) while a job for it is still
+    queued or running returns that job instead of starting another.
+    Poll GET /jobs/{job_id} until status is "done" or "failed".
+    """
+    try:
+        video_id = extract_video_id(str(request.url))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    store, pool = await asyncio.to_thread(get_job_queue)
+    job_id, coalesced = store.submit(video_id, {
+        "url": str(request.url),
+        "summary_type": request.summary_type,
+        "save_to_obsidian": request.save_to_obsidian,
+        "obsidian_vault_path": request.obsidian_vault_path,
+        "include_transcript": request.include_transcript
+    })
+    if not coalesced:
+        pool.submit(run_job, job_id)
+    return job_status(store.get(job_id), coalesced=coalesced)
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    """Status of a background job; `result` is filled in once it's done"""
+    store, _ = await asyncio.to_thread(get_job_queue)
+    row = store.get(job_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_status(row)
+
+
+def sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.get("/process/stream")
+async def stream_youtube_video(url: str, summary_type: str = "detailed", include_transcript: bool = True):
+    """
+    Streaming variant of /process using Server-Sent Events
+
+    Events:
+        meta   - {"video_id", "language"} once the transcript is fetched
+        delta  - {"text"} for each chunk of summary as Claude writes it
+        done   - {"video_id", "summary", "markdown_output"} at the end
+        error  - {"error"} if summarization fails mid-stream
+
+    Transcript errors are raised before the stream opens, as normal HTTP errors.
+    Pass include_transcript=false to leave the transcript out of markdown_output.
+    """
+    try:
+        video_id = extract_video_id(url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Blocking fetch runs off the event loop, shared with concurrent requests
+    transcript, language = await asyncio.to_thread(
+        single_flight("transcripts").do, video_id, lambda: get_transcript(video_id)
+    )
+
+    async def events():
+        yield sse_event("meta", {"video_id": video_id, "language": language})
+
+        parts = []
+        try:
+            async for text in stream_summary_with_claude(transcript, summary_type):
+                parts.append(text)
+                yield sse_event("delta", {"text": text})
+        except Exception as e:
+            yield sse_event("error", {"error": f"Error calling Claude API: {str(e)}"})
+            return
+
+        summary = "".join(parts)
+        yield sse_event("done", {
+            "video_id": video_id,
+            "summary": summary,
+            "markdown_output": format_for_obsidian(
+                video_id, url, summary, transcript if include_transcript else None
+            )
+        })
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Detailed health check"""
@@ -298,6 +644,7 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "claude_api_configured": api_key_present,
+        "single_flight": single_flight_stats(),
         "dependencies": {
             "youtube_transcript_api": True,
             "anthropic": True,
@@ -2,17 +2,61 @@
 YouTube Transcript API
 FastAPI endpoint for extracting YouTube transcripts.
 Deployed on Vercel for Claude.ai/Mac client access.
+
+Cold starts only import FastAPI and the light helpers in tools/;
+youtube-transcript-api loads on the first fetch (or GET /warmup).
+benchmarks/bench_cold_start.py keeps it that way.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-import re
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+# Shared helpers live alongside the CLI tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+
+from disk_cache import transcript_cache, transcript_key
+from http_compression import CompressionMiddleware
+from single_flight import single_flight, single_flight_stats
+from text_normalizer import count_words
+from transcript_model import Transcript
+from transcript_source import api_class, fetch_transcript_model
+from video_url import extract_video_id
 
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    TranscriptsDisabled,
-    NoTranscriptFound,
-    VideoUnavailable
+# youtube-transcript-api is blocking, so fetches run on a dedicated, bounded
+# pool instead of the event loop. Requests beyond the pool size queue here
+# rather than stalling /health and every other in-flight request.
+TRANSCRIPT_WORKERS = int(os.environ.get("TRANSCRIPT_WORKERS", "16"))
+# Per-request cap for POST /transcripts so one big batch can't hog the pool
+BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", "8"))
+MAX_BATCH_URLS = 500
+
+# HTTP caching for GET /transcript. Transcripts almost never change, so
+# browsers keep them a day and Vercel's edge (s-maxage) for 30 days -
+# repeat lookups are answered there without invoking this function.
+# "Transcripts disabled" and similar failures are cached briefly, since
+# a creator can turn captions on; unexpected errors are never cached.
+TRANSCRIPT_CACHE_CONTROL = os.environ.get(
+    "TRANSCRIPT_CACHE_CONTROL",
+    "public, max-age=86400, s-maxage=2592000, stale-while-revalidate=86400"
+)
+NEGATIVE_CACHE_CONTROL = os.environ.get(
+    "NEGATIVE_CACHE_CONTROL",
+    "public, max-age=300, s-maxage=600"
+)
+transcript_pool = ThreadPoolExecutor(
+    max_workers=TRANSCRIPT_WORKERS,
+    thread_name_prefix="transcript"
 )
 
 app = FastAPI(
@@ -25,44 +69,124 @@ app = FastAPI(
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_methods=["GET"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
+# brotli/gzip, negotiated per request - transcripts shrink several-fold
+app.add_middleware(CompressionMiddleware)
+
+
+def get_transcript(video_id: str, normalize: bool = False) -> Transcript:
+    """
+    Fetch transcript from YouTube video, keeping segment timings.
+    Verbatim captions unless `normalize` (see transcript_source).
+    """
+    # English if there is one, otherwise any track - one list, one fetch
+    return fetch_transcript_model(video_id, languages=['en'], normalize=normalize)
 
 
-def extract_video_id(url: str) -> str:
-    """Extract YouTube video ID from various URL formats."""
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'youtu\.be\/([0-9A-Za-z_-]{11})',
-        r'embed\/([0-9A-Za-z_-]{11})',
-    ]
+def content_hash(transcript: Transcript) -> str:
+    """Digest of everything a payload can contain - the basis for ETags."""
+    digest = hashlib.sha256()
+    digest.update(transcript.language.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(transcript.text.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(transcript.starts.tobytes())
+    digest.update(transcript.durations.tobytes())
+    return digest.hexdigest()[:32]
 
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
 
-    raise ValueError(f"Could not extract video ID from URL: {url}")
+def load_transcript(video_id: str, normalize: bool = False) -> tuple:
+    """
+    Transcript plus its word count and content hash, from the shared disk
+    cache when we've seen the video before. Both are stored alongside the
+    transcript so repeat lookups don't recompute them.
 
+    Returns: (Transcript, word_count, content_hash)
+    """
+    cache = transcript_cache()
+    key = transcript_key(video_id, normalized=normalize)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            transcript = Transcript.from_dict(hit)
+            if "word_count" in hit and "content_hash" in hit:
+                return transcript, hit["word_count"], hit["content_hash"]
+            # Written by another entry point: fill both in once, so the
+            # next hit doesn't recount a multi-hour transcript
+            word_count = count_words(transcript.text)
+            digest = content_hash(transcript)
+            cache.set(key, {**hit, "word_count": word_count, "content_hash": digest})
+            return transcript, word_count, digest
 
-def get_transcript(video_id: str) -> tuple:
-    """Fetch transcript from YouTube video."""
-    ytt_api = YouTubeTranscriptApi()
+    transcript = get_transcript(video_id, normalize)
+    word_count = count_words(transcript.text)
+    digest = content_hash(transcript)
+    if cache is not None:
+        cache.set(key, {
+            **transcript.to_dict(),
+            "word_count": word_count,
+            "content_hash": digest
+        })
+    return transcript, word_count, digest
 
-    try:
-        transcript_data = ytt_api.fetch(video_id, languages=['en'])
-        full_text = " ".join([item.text for item in transcript_data])
-        return full_text, 'en'
-    except:
-        # Fall back to any available transcript
-        transcript_list = ytt_api.list(video_id)
-        for transcript in transcript_list:
-            transcript_data = transcript.fetch()
-            full_text = " ".join([item.text for item in transcript_data])
-            return full_text, transcript.language_code
 
-    raise ValueError("No transcript found")
+async def fetch_transcript(video_id: str, normalize: bool = False) -> tuple:
+    """
+    Cached transcript lookup, run on the transcript pool. Concurrent
+    requests for the same video (and normalize setting) share one lookup.
+    """
+    return await single_flight("transcripts").do_async(
+        (video_id, normalize),
+        functools.partial(load_transcript, video_id, normalize),
+        transcript_pool
+    )
+
+
+# fields= projections: what each payload mode includes besides video_id
+FIELD_MODES = {
+    "full": ("success", "language", "transcript", "char_count", "word_count"),
+    "metadata": ("success", "language", "char_count", "word_count", "segment_count"),
+    "text": ("transcript",),
+    "segments": ("success", "language", "char_count", "word_count", "segments"),
+}
+
+
+def check_fields(fields: str) -> str:
+    """Validate a fields= value (raises 400 on unknown modes)."""
+    if fields not in FIELD_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"fields must be one of: {', '.join(FIELD_MODES)}"
+        )
+    return fields
+
+
+def transcript_payload(video_id: str, transcript: Transcript, word_count: int, fields: str = "full") -> dict:
+    """
+    Response body for one transcript, holding only what `fields` asks for.
+
+    metadata  - counts and language, no text (a few hundred bytes)
+    text      - just the transcript
+    segments  - per-segment start/duration/text instead of one string
+    """
+    values = {
+        "success": lambda: True,
+        "language": lambda: transcript.language,
+        "transcript": lambda: transcript.text,
+        "char_count": lambda: len(transcript.text),
+        "word_count": lambda: word_count,
+        "segment_count": lambda: len(transcript),
+        "segments": lambda: [
+            {"start": start, "duration": duration, "text": text}
+            for start, duration, text in transcript
+        ],
+    }
+    payload = {"video_id": video_id}
+    for name in FIELD_MODES[fields]:
+        payload[name] = values[name]()
+    return payload
 
 
 @app.get("/")
@@ -70,57 +194,216 @@ async def root():
     """Root endpoint with usage info."""
     return {
         "service": "YouTube Transcript API",
-        "usage": "GET /transcript?url=YOUTUBE_URL",
-        "example": "/transcript?url=https://youtu.be/dQw4w9WgXcQ"
+        "usage": "GET /transcript?url=YOUTUBE_URL[&fields=full|metadata|text|segments][&normalize=true]",
+        "example": "/transcript?url=https://youtu.be/dQw4w9WgXcQ",
+        "batch": "POST /transcripts {\"urls\": [...]} -> NDJSON stream",
+        "warmup": "GET /warmup - preload dependencies on a fresh instance"
     }
 
 
 @app.get("/health")
 async def health():
-    """Health check endpoint."""
-    return {"status": "ok"}
+    """Health check endpoint, with duplicate-request coalescing counters."""
+    return {"status": "ok", "single_flight": single_flight_stats()}
+
+
+def warm_up() -> dict:
+    """
+    Do the one-off work the first transcript request would otherwise pay
+    for: import youtube-transcript-api (and requests) and open the
+    transcript cache. Safe to call repeatedly; later calls are no-ops.
+
+    Returns: milliseconds spent per step
+    """
+    timings = {}
+
+    started = time.perf_counter()
+    api_class()
+    import youtube_transcript_api._errors  # noqa: F401 - for error_status
+    timings["youtube_transcript_api"] = round((time.perf_counter() - started) * 1000, 1)
+
+    started = time.perf_counter()
+    cache = transcript_cache()
+    if cache is not None:
+        cache.stats()
+    timings["transcript_cache"] = round((time.perf_counter() - started) * 1000, 1)
+    return timings
+
+
+@app.get("/warmup")
+async def warmup():
+    """
+    Warm-up hook: ping after a deploy, or on a schedule, so a fresh
+    instance has its heavy imports done before real traffic arrives.
+    """
+    loop = asyncio.get_running_loop()
+    timings = await loop.run_in_executor(transcript_pool, warm_up)
+    return {"status": "warm", "ms": timings}
+
+
+def error_cache_control(error: Exception) -> str:
+    """Cache-Control for a failed lookup: brief for known outcomes, none otherwise."""
+    status, _ = error_status(error)
+    return NEGATIVE_CACHE_CONTROL if status < 500 else "no-store"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match check (weak comparison, as RFC 9110 requires for it).
+
+    The compression middleware tags compressed variants "<etag>-gzip" /
+    "<etag>-br"; those validate the same transcript, so the suffix is
+    ignored here.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        for suffix in ("-gzip", "-br"):
+            if candidate.endswith(suffix):
+                candidate = candidate[:-len(suffix)]
+        if candidate == etag.strip('"'):
+            return True
+    return False
+
+
+# youtube-transcript-api errors by class name. They're looked up in the
+# already-imported library, so classifying an error (a bad URL, say)
+# never pulls the library into a cold start.
+LIBRARY_ERRORS = {
+    "TranscriptsDisabled": (400, "Transcripts are disabled for this video"),
+    "NoTranscriptFound": (404, "No transcript found for this video"),
+    "VideoUnavailable": (404, "Video is unavailable or does not exist"),
+}
+
+
+def error_status(error: Exception) -> tuple:
+    """Map a transcript failure to (HTTP status, message)."""
+    errors = sys.modules.get("youtube_transcript_api._errors")
+    if errors is not None:
+        for name, outcome in LIBRARY_ERRORS.items():
+            if isinstance(error, getattr(errors, name)):
+                return outcome
+    if isinstance(error, ValueError):
+        return 400, str(error)
+    return 500, f"Internal error: {str(error)}"
 
 
 @app.get("/transcript")
-async def transcript(url: str):
+async def transcript(
+    url: str,
+    response: Response,
+    fields: str = "full",
+    normalize: bool = False,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Extract transcript from a YouTube video.
 
+    Responses carry a strong ETag (transcript content hash + payload mode)
+    and a long Cache-Control; send If-None-Match to get a 304 instead of
+    the body when nothing changed.
+
     Args:
         url: YouTube video URL (supports youtube.com/watch, youtu.be, embed formats)
+        fields: Payload mode - full (default), metadata, text or segments
+        normalize: Clean captions ([Music], curly quotes, whitespace);
+            verbatim by default
 
     Returns:
         JSON with video_id, language, transcript text, and character count
+        (or the subset/shape chosen by `fields`)
     """
+    check_fields(fields)
     try:
         video_id = extract_video_id(url)
-        text, language = get_transcript(video_id)
-
-        return {
-            "success": True,
-            "video_id": video_id,
-            "language": language,
-            "transcript": text,
-            "char_count": len(text),
-            "word_count": len(text.split())
-        }
-
-    except TranscriptsDisabled:
-        raise HTTPException(
-            status_code=400,
-            detail="Transcripts are disabled for this video"
-        )
-    except NoTranscriptFound:
+        segments, word_count, digest = await fetch_transcript(video_id, normalize)
+    except Exception as e:
+        status, detail = error_status(e)
         raise HTTPException(
-            status_code=404,
-            detail="No transcript found for this video"
+            status_code=status,
+            detail=detail,
+            headers={"Cache-Control": error_cache_control(e)}
         )
-    except VideoUnavailable:
+
+    headers = {
+        "ETag": f'"{digest}.{fields}"',
+        "Cache-Control": TRANSCRIPT_CACHE_CONTROL,
+        # Also on 304s and uncompressed bodies, so caches key consistently
+        "Vary": "Accept-Encoding"
+    }
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return transcript_payload(video_id, segments, word_count, fields)
+
+
+class TranscriptsRequest(BaseModel):
+    urls: List[str]
+    fields: Optional[str] = "full"
+    normalize: bool = False
+
+
+@app.post("/transcripts")
+async def transcripts(request: TranscriptsRequest):
+    """
+    Extract transcripts for many videos in one call.
+
+    URLs are deduplicated by video ID and fetched with bounded concurrency.
+    The response is newline-delimited JSON: one object per video, written
+    as soon as that video finishes, so fast videos don't wait on slow ones.
+    Failures are reported inline with their HTTP-equivalent status.
+    `fields` and `normalize` work as for GET /transcript.
+    """
+    fields = check_fields(request.fields)
+    if len(request.urls) > MAX_BATCH_URLS:
         raise HTTPException(
-            status_code=404,
-            detail="Video is unavailable or does not exist"
+            status_code=413,
+            detail=f"At most {MAX_BATCH_URLS} URLs per batch"
         )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+    # Dedupe by video ID, keeping first-seen order
+    video_urls = {}
+    invalid = []
+    for url in request.urls:
+        try:
+            video_urls.setdefault(extract_video_id(url), url)
+        except ValueError as e:
+            invalid.append({"success": False, "url": url, "status": 400, "error": str(e)})
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def fetch_one(video_id: str, url: str) -> dict:
+        async with semaphore:
+            try:
+                segments, word_count, _ = await fetch_transcript(video_id, request.normalize)
+            except Exception as e:
+                status, detail = error_status(e)
+                return {
+                    "success": False,
+                    "url": url,
+                    "video_id": video_id,
+                    "status": status,
+                    "error": detail
+                }
+        return {"url": url, **transcript_payload(video_id, segments, word_count, fields)}
+
+    async def stream():
+        for item in invalid:
+            yield json.dumps(item) + "\n"
+        tasks = [
+            asyncio.ensure_future(fetch_one(video_id, url))
+            for video_id, url in video_urls.items()
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield json.dumps(await finished) + "\n"
+        finally:
+            # Client went away - don't keep fetching for nobody
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
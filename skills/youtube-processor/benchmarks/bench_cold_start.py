@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Cold Start Benchmark
+Measures what a fresh serverless instance pays before it can answer, and
+fails if the import-time budget regresses.
+
+Each run starts a new interpreter, as Vercel does on a cold start:
+
+    import   `python -X importtime` of the module; total, and the share
+             that is ours rather than FastAPI/pydantic's
+    process  launch -> first GET /health answered, minus bare interpreter
+             startup (the app's cold-start cost)
+    warmup   what GET /warmup then spends on the deferred imports
+
+Budget checks (exit status 1 on failure):
+    - heavy dependencies must not be imported at module load
+      (api: anthropic, youtube_transcript_api, requests, httpx;
+       core: anthropic, youtube_transcript_api, httpx)
+    - our own import time (p50) must stay under --budget-ms
+
+Usage:
+    python3 bench_cold_start.py
+    python3 bench_cold_start.py --runs 20 --output cold-start.json
+    python3 bench_cold_start.py --compare cold-start.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SKILL = os.path.dirname(HERE)
+
+# Packages counted as framework, not our import cost
+FRAMEWORK = ("fastapi", "starlette", "pydantic", "pydantic_core", "anyio", "typing_extensions")
+
+TARGETS = {
+    "api": {
+        "path": os.path.join(SKILL, "api"),
+        "module": "main",
+        "forbidden": ("anthropic", "youtube_transcript_api", "requests", "httpx"),
+        "budget_ms": 60.0,
+    },
+    "core": {
+        "path": os.path.join(SKILL, "tools"),
+        "module": "youtube_core",
+        "forbidden": ("anthropic", "youtube_transcript_api", "httpx"),
+        "budget_ms": 60.0,
+    },
+}
+
+# Child for the api target: import, answer GET /health over raw ASGI (no
+# test client, which would import httpx), then time the warm-up hook
+FIRST_REQUEST = """
+import asyncio, json, sys, time
+import main
+
+async def health():
+    sent = []
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        sent.append(message)
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+             "method": "GET", "scheme": "http", "path": "/health", "raw_path": b"/health",
+             "query_string": b"", "root_path": "", "headers": [],
+             "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80)}
+    await main.app(scope, receive, send)
+    return sent[0]["status"]
+
+status = asyncio.run(health())
+sys.stdout.write(json.dumps({"status": status, "warmup": main.warm_up()}))
+"""
+
+
+def child_env() -> dict:
+    env = dict(os.environ)
+    env["YOUTUBE_PROCESSOR_CACHE"] = "0"
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def parse_importtime(stderr: str, module: str) -> dict:
+    """
+    Pull one module's import tree out of -X importtime output.
+
+    Lines are "import time: self | cumulative | <indent>name" in
+    post-order: children are printed before the module importing them.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, int(cumulative), name.strip()))
+
+    for index, (depth, cumulative, name) in enumerate(rows):
+        if depth == 0 and name == module:
+            break
+    else:
+        raise RuntimeError(f"{module} not found in importtime output")
+
+    subtree = []
+    for child_depth, child_cumulative, child_name in reversed(rows[:index]):
+        if child_depth == 0:
+            break
+        subtree.append((child_depth, child_cumulative, child_name))
+
+    framework = sum(
+        c for d, c, n in subtree if d == 1 and n.split(".")[0] in FRAMEWORK
+    )
+    return {
+        "total_ms": cumulative / 1000,
+        "own_ms": (cumulative - framework) / 1000,
+        "modules": {n for _, _, n in subtree},
+    }
+
+
+def measure_import(target: dict) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target['module']}"],
+        cwd=target["path"], env=child_env(), capture_output=True, text=True, check=True
+    )
+    return parse_importtime(result.stderr, target["module"])
+
+
+def measure_process(args: list, cwd: str) -> tuple:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable] + args, cwd=cwd, env=child_env(),
+        capture_output=True, text=True, check=True
+    )
+    return (time.perf_counter() - started) * 1000, result.stdout
+
+
+def summarize(values: list) -> dict:
+    ordered = sorted(values)
+    return {
+        "p50": round(statistics.median(ordered), 1),
+        "p95": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+def bench_target(name: str, target: dict, runs: int, budget_ms: float) -> dict:
+    imports = [measure_import(target) for _ in range(runs)]
+    loaded = set().union(*(run["modules"] for run in imports))
+    leaked = sorted(
+        root for root in target["forbidden"]
+        if any(module == root or module.startswith(root + ".") for module in loaded)
+    )
+
+    report = {
+        "import_ms": summarize([run["total_ms"] for run in imports]),
+        "own_import_ms": summarize([run["own_ms"] for run in imports]),
+        "budget_ms": budget_ms,
+        "forbidden_imported": leaked,
+    }
+
+    if name == "api":
+        baseline, cold, warmups = [], [], []
+        for _ in range(runs):
+            baseline.append(measure_process(["-c", "pass"], target["path"])[0])
+            elapsed, stdout = measure_process(["-c", FIRST_REQUEST], target["path"])
+            child = json.loads(stdout)
+            if child["status"] != 200:
+                raise RuntimeError(f"/health returned {child['status']}")
+            cold.append(elapsed)
+            warmups.append(sum(child["warmup"].values()))
+        interpreter = statistics.median(baseline)
+        report["cold_start_ms"] = summarize([c - interpreter for c in cold])
+        report["interpreter_ms"] = round(interpreter, 1)
+        report["warmup_ms"] = summarize(warmups)
+
+    report["ok"] = not leaked and report["own_import_ms"]["p50"] <= budget_ms
+    return report
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=HERE, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(results: dict, baseline: dict = None) -> None:
+    for name, report in results["targets"].items():
+        before = (baseline or {}).get("targets", {}).get(name, {})
+        print(f"\n{name} ({'ok' if report['ok'] else 'OVER BUDGET'})")
+        for metric in ("import_ms", "own_import_ms", "cold_start_ms", "warmup_ms"):
+            if metric not in report:
+                continue
+            now = report[metric]["p50"]
+            line = f"  {metric:16} p50 {now:8.1f}  p95 {report[metric]['p95']:8.1f}"
+            if metric in before:
+                old = before[metric]["p50"]
+                change = f"{(now - old) / old:+.0%}" if old else "n/a"
+                line += f"   was {old:.1f} ({change})"
+            print(line)
+        print(f"  {'budget':16} own import p50 <= {report['budget_ms']:.0f} ms")
+        if report["forbidden_imported"]:
+            print(f"  imported at load: {', '.join(report['forbidden_imported'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start and enforce the import budget")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per measurement")
+    parser.add_argument("--budget-ms", type=float, help="Override every target's own-import budget")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    args = parser.parse_args()
+
+    results = {
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "runs": args.runs,
+        "targets": {
+            name: bench_target(name, target, args.runs, args.budget_ms or target["budget_ms"])
+            for name, target in TARGETS.items()
+        }
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+    if not all(report["ok"] for report in results["targets"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
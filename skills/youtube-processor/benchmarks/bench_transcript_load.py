@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Transcript API Load Benchmark
+Hammers GET /transcript with concurrent clients and reports requests/sec
+and latency percentiles.
+
+YouTube is replaced by a local stub transcript server that answers after a
+fixed delay, so the numbers measure how well the API overlaps slow fetches
+rather than how fast YouTube is today. The transcript cache is disabled.
+
+Usage:
+    python3 bench_transcript_load.py
+    python3 bench_transcript_load.py --clients 50 --requests 500 --latency 0.2
+    TRANSCRIPT_WORKERS=1 python3 bench_transcript_load.py   # serialised baseline
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ["YOUTUBE_PROCESSOR_CACHE"] = "0"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "api"))
+
+import uvicorn
+import main as api
+from transcript_model import Transcript
+
+
+STUB_TEXT = " ".join(["never gonna give you up"] * 400)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_stub_server(latency: float) -> int:
+    """Local stand-in for YouTube: sleeps `latency` seconds, returns JSON."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps({"text": STUB_TEXT, "language": "en"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    port = free_port()
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return port
+
+
+def start_api_server() -> int:
+    port = free_port()
+    config = uvicorn.Config(api.app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return port
+
+
+def run_load(port: int, clients: int, total: int) -> list:
+    """Each client keeps one connection open and fires requests back to back."""
+    counter = iter(range(total))
+    lock = threading.Lock()
+    latencies = []
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        local = []
+        while True:
+            with lock:
+                n = next(counter, None)
+            if n is None:
+                break
+            # Unique IDs so nothing is shared between requests
+            video_id = f"bench{n:06d}"[:11]
+            started = time.perf_counter()
+            conn.request("GET", f"/transcript?url=https://youtu.be/{video_id}")
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            local.append(time.perf_counter() - started)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for future in [pool.submit(client) for _ in range(clients)]:
+            future.result()
+    return latencies
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test GET /transcript")
+    parser.add_argument("--clients", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=500, help="Total requests")
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub fetch latency (s)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    stub_port = start_stub_server(args.latency)
+    stub_url = f"http://127.0.0.1:{stub_port}/"
+
+    def stub_get_transcript(video_id: str, normalize: bool = False) -> Transcript:
+        with urllib.request.urlopen(stub_url + video_id) as response:
+            data = json.load(response)
+        return Transcript.from_text(data["text"], data["language"])
+
+    api.get_transcript = stub_get_transcript
+    api_port = start_api_server()
+
+    started = time.perf_counter()
+    latencies = run_load(api_port, args.clients, args.requests)
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "clients": args.clients,
+        "requests": len(latencies),
+        "transcript_workers": api.TRANSCRIPT_WORKERS,
+        "stub_latency_ms": round(args.latency * 1000, 1),
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(max(latencies) * 1000, 1)
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:>20}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Video URL Parser Benchmark
+Checks tools/video_url.py against a URL corpus and randomly generated
+URLs, then times it against the old three-regex parser.
+
+Exits non-zero if any URL parses to the wrong ID, so it doubles as a
+correctness check before touching the parser.
+
+Usage:
+    python3 bench_video_url.py
+    python3 bench_video_url.py --urls 1000000 --seed 7
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+
+from video_url import VIDEO_ID_PATTERN, parse_video_id, _parse_with_urlsplit
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "video_url_corpus.tsv")
+ID_ALPHABET = string.ascii_letters + string.digits + "-_"
+
+# Every shape a real video URL can take; {id} is substituted
+VIDEO_TEMPLATES = [
+    "https://www.youtube.com/watch?v={id}",
+    "https://youtube.com/watch?v={id}&t={n}s",
+    "https://m.youtube.com/watch?feature=share&v={id}",
+    "https://music.youtube.com/watch?v={id}&list=RD{id}",
+    "youtube.com/watch?v={id}",
+    "https://youtu.be/{id}",
+    "https://youtu.be/{id}?si={junk}",
+    "https://www.youtube.com/embed/{id}?start={n}",
+    "https://www.youtube-nocookie.com/embed/{id}",
+    "https://www.youtube.com/shorts/{id}",
+    "https://www.youtube.com/live/{id}?si={junk}",
+    "https://www.youtube.com/v/{id}",
+]
+
+# Valid but unusual - these take the urllib.parse fallback, so they're
+# checked for correctness but left out of the timing mix
+FALLBACK_TEMPLATES = [
+    "HTTPS://WWW.YOUTUBE.COM/watch?v={id}",
+    "https://www.youtube.com:443/watch?v={id}",
+    "https://gaming.youtube.com/watch?v={id}",
+    "//youtu.be/{id}",
+]
+
+# Shapes that must never produce an ID
+NON_VIDEO_TEMPLATES = [
+    "https://www.youtube.com/channel/UC{junk}",
+    "https://www.youtube.com/@{junk}",
+    "https://www.youtube.com/playlist?list=PL{junk}",
+    "https://www.youtube.com/results?search_query={junk}",
+    "https://example.com/watch?v={id}",
+    "https://www.youtube.com/watch?v={id}{junk}",
+]
+
+
+def legacy_extract_video_id(url: str) -> str:
+    """The parser this module replaced, kept for timing comparisons."""
+    patterns = [
+        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
+        r'youtu\.be\/([0-9A-Za-z_-]{11})',
+        r'embed\/([0-9A-Za-z_-]{11})',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, url)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def slow_path(url: str) -> str:
+    """parse_video_id with the fast pattern skipped - the two must agree."""
+    url = url.strip()
+    if VIDEO_ID_PATTERN.fullmatch(url):
+        return url
+    return _parse_with_urlsplit(url)
+
+
+def random_token(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(ID_ALPHABET) for _ in range(length))
+
+
+def generate(rng: random.Random, templates: list) -> tuple:
+    video_id = random_token(rng, 11)
+    url = rng.choice(templates).format(
+        id=video_id,
+        junk=random_token(rng, rng.randint(1, 16)),
+        n=rng.randint(0, 9999)
+    )
+    return url, video_id
+
+
+def check_corpus() -> int:
+    failures = 0
+    with open(CORPUS, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            url, expected = line.rsplit("\t", 1)
+            expected = "" if expected == "-" else expected
+            got = parse_video_id(url)
+            if got != expected or slow_path(url) != expected:
+                failures += 1
+                print(f"  corpus: {url!r} -> {got!r}, expected {expected!r}")
+    return failures
+
+
+def check_generated(rng: random.Random, count: int) -> int:
+    failures = 0
+    for _ in range(count):
+        url, video_id = generate(rng, VIDEO_TEMPLATES + FALLBACK_TEMPLATES)
+        if parse_video_id(url) != video_id or slow_path(url) != video_id:
+            failures += 1
+            print(f"  generated: {url!r} should give {video_id!r}")
+        url, _ = generate(rng, NON_VIDEO_TEMPLATES)
+        if parse_video_id(url) or slow_path(url):
+            failures += 1
+            print(f"  generated: {url!r} should be rejected")
+    return failures
+
+
+def time_parser(parse, urls: list) -> float:
+    started = time.perf_counter()
+    for url in urls:
+        parse(url)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the video URL parser")
+    parser.add_argument("--urls", type=int, default=200000, help="URLs to time")
+    parser.add_argument("--checks", type=int, default=20000, help="Generated URLs to verify")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    failures = check_corpus() + check_generated(rng, args.checks)
+    print(f"Correctness: {'OK' if not failures else f'{failures} FAILURES'}")
+
+    urls = [generate(rng, VIDEO_TEMPLATES)[0] for _ in range(args.urls)]
+    new = time_parser(parse_video_id, urls)
+    old = time_parser(legacy_extract_video_id, urls)
+    print(f"{len(urls)} URLs:")
+    print(f"  video_url.parse_video_id  {new:.2f}s  ({len(urls) / new:,.0f} URLs/sec)")
+    print(f"  legacy three-regex parser {old:.2f}s  ({len(urls) / old:,.0f} URLs/sec)")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Shared pytest setup: the tools and API modules are imported the way the
+CLI and Vercel import them (by directory on sys.path), and every test
+gets its own empty disk cache.
+"""
+
+import os
+import sys
+
+import pytest
+
+SKILL = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(SKILL, "tools"))
+sys.path.insert(0, os.path.join(SKILL, "api"))
+
+import disk_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """A fresh cache directory per test; cache handles aren't shared across tests."""
+    monkeypatch.setenv("YOUTUBE_PROCESSOR_CACHE", "1")
+    monkeypatch.setenv("YOUTUBE_PROCESSOR_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(disk_cache, "_caches", {})
+    return tmp_path / "cache"
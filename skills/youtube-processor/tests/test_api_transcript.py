@@ -0,0 +1,106 @@
+"""GET /transcript: cached lookups, ETags and 304 revalidation."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from disk_cache import transcript_cache, transcript_key
+from transcript_model import Transcript
+
+URL = "https://youtu.be/dQw4w9WgXcQ"
+VIDEO_ID = "dQw4w9WgXcQ"
+TEXT = "never gonna give you up " * 50
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """Stand-in YouTube fetch; the list records each video fetched."""
+    calls = []
+
+    def fake_get_transcript(video_id, normalize=False):
+        calls.append(video_id)
+        return Transcript.from_text(TEXT.strip(), "en")
+
+    monkeypatch.setattr(main, "get_transcript", fake_get_transcript)
+    return calls
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def get(client, etag=None, encoding="identity", **params):
+    headers = {"Accept-Encoding": encoding}
+    if etag:
+        headers["If-None-Match"] = etag
+    return client.get("/transcript", params={"url": URL, **params}, headers=headers)
+
+
+def test_response_carries_strong_etag(client, fetched):
+    response = get(client)
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == main.TRANSCRIPT_CACHE_CONTROL
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_etag_depends_on_fields(client, fetched):
+    assert get(client).headers["etag"] != get(client, fields="metadata").headers["etag"]
+
+
+def test_matching_etag_gets_304(client, fetched):
+    etag = get(client).headers["etag"]
+    response = get(client, etag=etag)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert fetched == [VIDEO_ID]
+
+
+def test_stale_etag_gets_body(client, fetched):
+    response = get(client, etag='"something-else.full"')
+    assert response.status_code == 200
+    assert response.json()["transcript"] == TEXT.strip()
+
+
+def test_304_matches_compressed_etag(client, fetched):
+    compressed = get(client, encoding="gzip")
+    assert compressed.headers["content-encoding"] == "gzip"
+    etag = compressed.headers["etag"]
+    assert etag.endswith('-gzip"')
+
+    response = get(client, etag=etag, encoding="gzip")
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("header,matches", [
+    ('"abc.full"', True),
+    ('W/"abc.full"', True),
+    ('"abc.full-gzip"', True),
+    ('"other", "abc.full-br"', True),
+    ("*", True),
+    ('"abc.text"', False),
+])
+def test_etag_matches(header, matches):
+    assert main.etag_matches(header, '"abc.full"') is matches
+
+
+def test_cache_entry_from_another_entry_point_is_filled_in_once(fetched, monkeypatch):
+    # As written by youtube_core: no word_count / content_hash
+    transcript_cache().set(transcript_key(VIDEO_ID), Transcript.from_text("a b c", "en").to_dict())
+    counted = []
+    real_count_words = main.count_words
+    monkeypatch.setattr(main, "count_words", lambda text: counted.append(text) or real_count_words(text))
+
+    first = main.load_transcript(VIDEO_ID)
+    second = main.load_transcript(VIDEO_ID)
+
+    assert first[1:] == second[1:]
+    assert first[1] == 3
+    assert len(counted) == 1
+    stored = transcript_cache().get(transcript_key(VIDEO_ID))
+    assert stored["word_count"] == 3
+    assert stored["content_hash"] == first[2]
+    assert fetched == []
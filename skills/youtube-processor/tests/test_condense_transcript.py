@@ -0,0 +1,96 @@
+"""Long transcripts are split into chunks before summarizing."""
+
+import pytest
+
+import youtube_core
+from disk_cache import transcript_cache, transcript_key
+
+SENTENCE = "Never gonna give you up, never gonna let you down. "
+MAX_CHUNK_TOKENS = youtube_core.MIN_CHUNK_TOKENS
+MAX_CHARS = MAX_CHUNK_TOKENS * youtube_core.CHARS_PER_TOKEN
+
+
+@pytest.fixture
+def long_text():
+    """About 40 chunks' worth of punctuated speech."""
+    target = MAX_CHARS * 40
+    return (SENTENCE * (target // len(SENTENCE) + 1)).strip()
+
+
+@pytest.fixture
+def sent_chunks(monkeypatch):
+    """Stub Claude; the list fills with every chunk it's asked about."""
+    chunks = []
+
+    def fake_complete(prompt, text, api_key=None, use_cache=True):
+        chunks.append(text)
+        return "notes"
+
+    monkeypatch.setattr(youtube_core, "_complete", fake_complete)
+    return chunks
+
+
+def condense(transcript):
+    return youtube_core.condense_transcript(
+        transcript, max_chunk_tokens=MAX_CHUNK_TOKENS, use_cache=False
+    )
+
+
+def test_flat_text_is_chunked(long_text, sent_chunks):
+    condense(long_text)
+
+    assert len(sent_chunks) > 1
+    assert all(len(chunk) <= MAX_CHARS for chunk in sent_chunks)
+
+
+def test_untimed_cache_entry_is_chunked(long_text, sent_chunks):
+    # Entries cached before segment timing was kept have only text/language
+    transcript_cache().set(transcript_key("untimedvid0"), {"text": long_text, "language": "en"})
+    transcript = youtube_core.get_segmented_transcript("untimedvid0")
+    assert len(transcript) == 1
+
+    condense(transcript)
+    from_cache = list(sent_chunks)
+    sent_chunks.clear()
+    condense(long_text)
+
+    assert len(from_cache) > 1
+    assert all(len(chunk) <= MAX_CHARS for chunk in from_cache)
+    assert len(from_cache) == len(sent_chunks)
+
+
+def test_short_transcript_is_returned_unchanged(sent_chunks):
+    assert condense("short") == "short"
+    assert sent_chunks == []
+
+
+def test_stops_when_notes_do_not_shrink(long_text, monkeypatch):
+    calls = []
+
+    def verbose_complete(prompt, text, api_key=None, use_cache=True):
+        calls.append(text)
+        return text + " and more"
+
+    monkeypatch.setattr(youtube_core, "_complete", verbose_complete)
+    assert condense(long_text) == long_text
+    # One pass over the chunks, then it gives up
+    assert len(calls) == len(youtube_core.chunk_transcript(long_text, MAX_CHUNK_TOKENS))
+
+
+def test_passes_are_capped(long_text, monkeypatch):
+    passes = []
+
+    def slow_shrink(prompt, text, api_key=None, use_cache=True):
+        passes.append(text)
+        return text[:int(len(text) * 0.9)]
+
+    monkeypatch.setattr(youtube_core, "_complete", slow_shrink)
+    condense(long_text)
+    per_pass = len(youtube_core.chunk_transcript(long_text, MAX_CHUNK_TOKENS))
+    assert len(passes) <= per_pass * youtube_core.MAX_CONDENSE_PASSES
+
+
+def test_rejects_chunks_smaller_than_notes(sent_chunks):
+    with pytest.raises(ValueError):
+        youtube_core.condense_transcript("x" * 10000, max_chunk_tokens=100)
+    assert sent_chunks == []
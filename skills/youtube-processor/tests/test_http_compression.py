@@ -0,0 +1,118 @@
+"""Accept-Encoding negotiation and the compression middleware."""
+
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+import http_compression
+from http_compression import CompressionMiddleware, choose_encoding
+
+BODY = {"transcript": "never gonna give you up " * 100}
+
+
+@pytest.fixture(params=[False, True], ids=["gzip-only", "with-brotli"])
+def brotli_available(request, monkeypatch):
+    """Negotiate as if the optional brotli package were (not) installed."""
+    if not request.param:
+        monkeypatch.setattr(http_compression, "brotli", None)
+    elif http_compression.brotli is None:
+        monkeypatch.setattr(http_compression, "brotli", object())
+    return request.param
+
+
+@pytest.mark.parametrize("header,gzip_only,with_brotli", [
+    ("gzip", "gzip", "gzip"),
+    ("br", None, "br"),
+    ("gzip, br", "gzip", "br"),
+    ("br;q=0.5, gzip;q=0.8", "gzip", "gzip"),
+    ("gzip;q=0", None, None),
+    ("*", "gzip", "br"),
+    ("*;q=0.1, gzip;q=0", None, "br"),
+    ("identity", None, None),
+    ("GZIP ; q=1.0", "gzip", "gzip"),
+    ("gzip;q=bogus", None, None),
+])
+def test_choose_encoding(brotli_available, header, gzip_only, with_brotli):
+    assert choose_encoding(header) == (with_brotli if brotli_available else gzip_only)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # gzip is always available; keep these tests independent of brotli
+    monkeypatch.setattr(http_compression, "brotli", None)
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/big")
+    async def big():
+        return BODY
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/small-etag")
+    async def small_etag(response: Response):
+        response.headers["ETag"] = '"v1"'
+        return {"ok": True}
+
+    @app.get("/binary")
+    async def binary():
+        return Response(b"\0" * 2000, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(3):
+                yield json.dumps({"i": i}) + "\n"
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+def raw_get(client, path, encoding):
+    """GET without httpx decoding the body for us."""
+    with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_large_json_is_gzipped(client):
+    response, raw = raw_get(client, "/big", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(raw) < len(json.dumps(BODY))
+    assert json.loads(gzip.decompress(raw)) == BODY
+
+
+def test_identity_passes_through(client):
+    response, raw = raw_get(client, "/big", "identity")
+    assert "content-encoding" not in response.headers
+    assert json.loads(raw) == BODY
+
+
+def test_small_response_is_not_compressed(client):
+    response, _ = raw_get(client, "/small", "gzip")
+    assert "content-encoding" not in response.headers
+
+
+def test_small_response_with_strong_etag_is_compressed_and_tagged(client):
+    response, raw = raw_get(client, "/small-etag", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == '"v1-gzip"'
+    assert json.loads(gzip.decompress(raw)) == {"ok": True}
+
+
+def test_binary_is_not_compressed(client):
+    response, _ = raw_get(client, "/binary", "gzip")
+    assert "content-encoding" not in response.headers
+
+
+def test_ndjson_stream_is_compressed_line_by_line(client):
+    response, raw = raw_get(client, "/stream", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert [json.loads(line) for line in lines] == [{"i": 0}, {"i": 1}, {"i": 2}]
@@ -0,0 +1,76 @@
+"""Transcript: compact segment storage, cache round-trip and chunking."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from transcript_model import Transcript
+
+
+def snippets(*texts, duration=2.0):
+    return [
+        SimpleNamespace(text=text, start=i * duration, duration=duration)
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def transcript():
+    return Transcript.from_snippets(snippets("one two", "three", "four five six", "seven"), "en")
+
+
+def test_from_snippets_joins_text_and_keeps_segments(transcript):
+    assert transcript.text == "one two three four five six seven"
+    assert len(transcript) == 4
+    assert transcript.segment(2) == (4.0, 2.0, "four five six")
+    assert [text for _, _, text in transcript] == ["one two", "three", "four five six", "seven"]
+
+
+def test_clean_drops_segments_left_empty():
+    transcript = Transcript.from_snippets(snippets("[Music]", "hello"), "en", clean=lambda t: t.strip("[Music]"))
+    assert transcript.text == "hello"
+    assert len(transcript) == 1
+    assert transcript.segment(0) == (2.0, 2.0, "hello")
+
+
+def test_dict_round_trip(transcript):
+    restored = Transcript.from_dict(transcript.to_dict())
+
+    assert restored.text == transcript.text
+    assert restored.language == "en"
+    assert list(restored.bounds) == list(transcript.bounds)
+    assert list(restored.starts) == list(transcript.starts)
+    assert list(restored.durations) == list(transcript.durations)
+
+
+def test_from_dict_without_timing_is_one_segment():
+    restored = Transcript.from_dict({"text": "plain words", "language": "de"})
+    assert len(restored) == 1
+    assert restored.segment(0) == (0.0, 0.0, "plain words")
+
+
+def test_slice_rebases_offsets(transcript):
+    part = transcript.slice(1, 3)
+    assert part.text == "three four five six"
+    assert part.segment(0) == (2.0, 2.0, "three")
+    assert part.segment(1) == (4.0, 2.0, "four five six")
+
+
+@pytest.mark.parametrize("max_chars", [1, 5, 13, 20, 1000])
+def test_chunk_ranges_cover_every_segment_in_order(transcript, max_chars):
+    ranges = transcript.chunk_ranges(max_chars)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(transcript)
+    assert all(stop == next_start for (_, stop), (next_start, _) in zip(ranges, ranges[1:]))
+    for start, stop in ranges:
+        assert stop > start
+        # Only a lone oversized segment may exceed the budget
+        if stop - start > 1:
+            assert transcript.bounds[stop] - transcript.bounds[start] - 1 <= max_chars
+
+
+def test_chunk_texts_are_slices_of_the_text(transcript):
+    chunks = transcript.chunk_texts(13)
+    assert " ".join(chunks) == transcript.text
+    assert all(len(chunk) <= 13 for chunk in chunks)
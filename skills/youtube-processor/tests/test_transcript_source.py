@@ -0,0 +1,64 @@
+"""Caption text is verbatim unless a caller opts into normalization."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import transcript_source
+import youtube_core
+
+SNIPPETS = [
+    SimpleNamespace(text="[Music]", start=0.0, duration=1.0),
+    SimpleNamespace(text="plot f(x) from  (2019)", start=1.0, duration=2.0),
+    SimpleNamespace(text="it’s fine", start=3.0, duration=1.5),
+]
+
+
+class FakeTrack:
+    language_code = "en"
+
+    def fetch(self):
+        return SNIPPETS
+
+
+class FakeTrackList:
+    def find_transcript(self, languages):
+        return FakeTrack()
+
+    def __iter__(self):
+        return iter([FakeTrack()])
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Stand-in YouTubeTranscriptApi; counts list() calls."""
+    calls = []
+
+    class FakeApi:
+        def list(self, video_id):
+            calls.append(video_id)
+            return FakeTrackList()
+
+    monkeypatch.setattr(transcript_source, "YouTubeTranscriptApi", FakeApi)
+    return calls
+
+
+def test_raw_by_default(fetches):
+    transcript = transcript_source.fetch_transcript_model("vid")
+    assert transcript.text == "[Music] plot f(x) from  (2019) it’s fine"
+    assert len(transcript) == 3
+
+
+def test_normalize_opt_in(fetches):
+    transcript = transcript_source.fetch_transcript_model("vid", normalize=True)
+    assert transcript.text == "plot f from it's fine"
+    assert transcript.starts.tolist() == [1.0, 3.0]
+
+
+def test_raw_and_clean_copies_cached_separately(fetches):
+    raw, _ = youtube_core.get_transcript("vid")
+    clean, _ = youtube_core.get_transcript("vid", normalize=True)
+    assert raw != clean
+    assert youtube_core.get_transcript("vid")[0] == raw
+    assert youtube_core.get_transcript("vid", normalize=True)[0] == clean
+    assert fetches == ["vid", "vid"]
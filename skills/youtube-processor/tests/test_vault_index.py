@@ -0,0 +1,114 @@
+"""Idempotent note writes and the on-disk video_id -> note index."""
+
+import json
+import os
+
+import pytest
+
+from note_template import NoteTemplate
+from vault_index import INDEX_DIR, INDEX_FILE, REGENERATED_SUFFIX, VaultIndex
+
+NOTE = NoteTemplate("processed: {timestamp}\n# {title}\n\n{body}\n")
+
+
+@pytest.fixture
+def vault(tmp_path):
+    return str(tmp_path / "vault")
+
+
+@pytest.fixture
+def index(vault):
+    os.makedirs(vault)
+    return VaultIndex(vault)
+
+
+def index_lines(vault):
+    with open(os.path.join(vault, INDEX_DIR, INDEX_FILE), encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_new_video_creates_note(index, vault):
+    path, written = index.write_note("vid", "# One\n", "One.md")
+    assert written
+    assert path == os.path.join(vault, "One.md")
+    assert index.get("vid")["path"] == path
+    assert index_lines(vault)[0]["path"] == "One.md"
+
+
+def test_same_content_writes_nothing(index):
+    path, _ = index.write_note("vid", NOTE.bind(timestamp="1", title="T", body="b"), "T.md")
+    mtime = os.stat(path).st_mtime_ns
+    again, written = index.write_note("vid", NOTE.bind(timestamp="2", title="T", body="b"), "Other.md")
+    assert (again, written) == (path, False)
+    assert os.stat(path).st_mtime_ns == mtime
+
+
+def test_changed_content_replaces_note_in_place(index):
+    path, _ = index.write_note("vid", "# One\n", "One.md")
+    again, written = index.write_note("vid", "# Two\n", "Renamed.md")
+    assert (again, written) == (path, True)
+    assert read(path) == "# Two\n"
+
+
+def test_streamed_chunks_are_indexed(index):
+    chunks = NOTE.iter_chunks(timestamp="1", title="T", body="b")
+    path, written = index.write_note("vid", chunks, "T.md")
+    assert written
+    assert index.write_note("vid", NOTE.bind(timestamp="9", title="T", body="b"), "T.md") == (path, False)
+
+
+def test_hand_edited_note_is_kept(index):
+    path, _ = index.write_note("vid", "# One\n", "One.md")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("my own notes\n")
+
+    regenerated, written = index.write_note("vid", "# Two\n", "One.md")
+    assert written
+    assert regenerated == path[:-len(".md")] + REGENERATED_SUFFIX + ".md"
+    assert read(path) == "# One\nmy own notes\n"
+    assert read(regenerated) == "# Two\n"
+    # The index still points at the user's note
+    assert index.get("vid")["path"] == path
+
+
+def test_deleted_note_is_recreated(index):
+    path, _ = index.write_note("vid", "# One\n", "One.md")
+    os.unlink(path)
+    assert index.get("vid") is None
+    assert index.write_note("vid", "# One\n", "One.md") == (path, True)
+
+
+def test_compaction_keeps_one_line_per_video(index, vault):
+    for i in range(120):
+        index.write_note("vid", f"# Version {i}\n", "Note.md")
+    index.write_note("other", "# Other\n", "Other.md")
+    lines = index_lines(vault)
+    assert len(lines) < 120
+    latest = {entry["video_id"]: entry for entry in lines}
+    assert set(latest) == {"vid", "other"}
+    assert VaultIndex(vault).get("vid")["hash"] == index.get("vid")["hash"]
+
+
+def test_sees_writes_from_another_instance(index, vault):
+    # A second process, as far as the index file is concerned
+    other = VaultIndex(vault)
+    assert index.get("vid") is None
+
+    path, _ = other.write_note("vid", "# One\n", "One.md")
+    assert index.get("vid")["path"] == path
+    # Upserts the other instance's note instead of creating a second one
+    assert index.write_note("vid", "# One\n", "Elsewhere.md") == (path, False)
+    assert not os.path.exists(os.path.join(vault, "Elsewhere.md"))
+
+
+def test_compaction_keeps_another_instances_entries(index, vault):
+    other = VaultIndex(vault)
+    other.write_note("theirs", "# Theirs\n", "Theirs.md")
+    for i in range(120):
+        index.write_note("vid", f"# Version {i}\n", "Note.md")
+    assert VaultIndex(vault).get("theirs") is not None
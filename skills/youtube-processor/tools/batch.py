@@ -0,0 +1,285 @@
+"""
+Batch Runner
+Resumable multi-video pipeline for playlists, channels and URL lists.
+
+Videos flow through two bounded stages connected by queues:
+
+    fetch workers  ->  [queue]  ->  summarize workers  ->  checkpoint file
+
+Fetching (YouTube) and summarizing (Claude) overlap, so a backfill runs
+at the speed of the slower stage rather than the sum of both. Every
+finished video is appended to a JSON-lines checkpoint; re-running with
+the same checkpoint skips videos already done and retries failures.
+If the run is interrupted (Ctrl-C), workers stop writing before the
+checkpoint is closed; videos still in flight are simply redone next time.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from youtube_core import (
+    extract_video_id,
+    get_segmented_transcript,
+    process_transcript,
+    estimate_tokens,
+    ProcessingResult
+)
+
+
+@dataclass
+class BatchReport:
+    """End-of-run summary for a batch"""
+    total: int = 0
+    processed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    estimated_tokens: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def videos_per_min(self) -> float:
+        return round(self.processed / self.elapsed * 60, 1) if self.elapsed else 0.0
+
+    @property
+    def tokens_per_sec(self) -> float:
+        return round(self.estimated_tokens / self.elapsed, 1) if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "elapsed_sec": round(self.elapsed, 1),
+            "videos_per_min": self.videos_per_min,
+            "estimated_tokens": self.estimated_tokens,
+            "tokens_per_sec": self.tokens_per_sec,
+            "errors": self.errors
+        }
+
+
+def read_urls_file(path: str) -> List[str]:
+    """One URL per line; blank lines and # comments are ignored."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.strip().startswith("#")
+        ]
+
+
+def _flat_entries(info: Dict) -> List[Dict]:
+    """Flatten yt-dlp entries - channel pages nest tabs inside playlists."""
+    entries = []
+    for entry in info.get("entries") or []:
+        if not entry:
+            continue
+        if entry.get("entries"):
+            entries.extend(_flat_entries(entry))
+        else:
+            entries.append(entry)
+    return entries
+
+
+def expand_playlist(url: str) -> List[str]:
+    """
+    List every video URL in a playlist or channel page, without
+    downloading anything. Needs yt-dlp.
+    """
+    try:
+        import yt_dlp
+    except ImportError:
+        raise ValueError("yt-dlp not installed. Install with: pip install yt-dlp")
+
+    opts = {
+        'extract_flat': 'in_playlist',
+        'skip_download': True,
+        'quiet': True,
+        'no_warnings': True,
+    }
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    return [
+        f"https://www.youtube.com/watch?v={entry['id']}"
+        for entry in _flat_entries(info)
+        if entry.get("id")
+    ]
+
+
+def expand_channel(channel: str) -> List[str]:
+    """
+    List a channel's uploads. Accepts a channel URL or an @handle.
+    """
+    if channel.startswith("@"):
+        channel = f"https://www.youtube.com/{channel}"
+    channel = channel.rstrip("/")
+    if not channel.endswith("/videos"):
+        channel += "/videos"
+    return expand_playlist(channel)
+
+
+def load_checkpoint(path: str) -> Dict[str, Dict]:
+    """Latest checkpoint record per video ID."""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn last line from an interrupted run
+                continue
+            records[record["video_id"]] = record
+    return records
+
+
+def run_batch(
+    urls: List[str],
+    checkpoint_path: Optional[str] = None,
+    fetch_workers: int = 4,
+    summarize_workers: int = 4,
+    use_cache: bool = True,
+    on_result: Optional[Callable[[ProcessingResult], None]] = None,
+    **process_options
+) -> BatchReport:
+    """
+    Process many videos through the two-stage pipeline.
+
+    Args:
+        urls: YouTube URLs; duplicates (by video ID) are processed once
+        checkpoint_path: JSON-lines file for resuming; None disables it
+        fetch_workers: Concurrent transcript fetches
+        summarize_workers: Concurrent summarize/save workers
+        use_cache: Passed through to the transcript and summary caches
+        on_result: Called with each ProcessingResult as it completes
+        **process_options: Passed to process_transcript (summary_type,
+            save_to_vault, vault_path, summary_types, ...)
+
+    Returns:
+        BatchReport with counts and throughput
+    """
+    report = BatchReport()
+    done = load_checkpoint(checkpoint_path) if checkpoint_path else {}
+
+    pending = {}
+    seen = set()
+    for url in urls:
+        try:
+            video_id = extract_video_id(url)
+        except ValueError as e:
+            report.failed += 1
+            report.errors[url] = str(e)
+            continue
+        if video_id in seen:
+            continue
+        seen.add(video_id)
+        if done.get(video_id, {}).get("status") == "done":
+            report.skipped += 1
+            continue
+        pending[video_id] = url
+    report.total = len(pending) + report.skipped + report.failed
+
+    fetch_queue: "queue.Queue" = queue.Queue()
+    for video_id, url in pending.items():
+        fetch_queue.put((video_id, url))
+    # Bounded so fetchers can't run far ahead of Claude and hold
+    # hundreds of transcripts in memory
+    summarize_queue: "queue.Queue" = queue.Queue(maxsize=summarize_workers * 2)
+
+    lock = threading.Lock()
+    # Set under `lock` when the run ends; workers write nothing after it
+    stop = threading.Event()
+    checkpoint = open(checkpoint_path, 'a', encoding='utf-8') if checkpoint_path else None
+
+    def record(
+        video_id: str,
+        url: str,
+        result: ProcessingResult,
+        transcript_tokens: int = 0
+    ) -> None:
+        with lock:
+            if stop.is_set():
+                return
+            if result.success:
+                report.processed += 1
+                # Counted at fetch - result.transcript is None under --no-transcript
+                report.estimated_tokens += (
+                    transcript_tokens + estimate_tokens(result.summary or "")
+                )
+            else:
+                report.failed += 1
+                report.errors[video_id] = result.error
+            if checkpoint is not None:
+                checkpoint.write(json.dumps({
+                    "video_id": video_id,
+                    "url": url,
+                    "status": "done" if result.success else "failed",
+                    "saved_to": result.saved_to,
+                    "error": result.error,
+                    "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+                }) + "\n")
+                checkpoint.flush()
+        if on_result is not None:
+            on_result(result)
+
+    def fetcher() -> None:
+        while not stop.is_set():
+            try:
+                video_id, url = fetch_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                segments = get_segmented_transcript(video_id, use_cache=use_cache, normalize=True)
+                summarize_queue.put((video_id, url, segments, estimate_tokens(segments.text)))
+            except Exception as e:
+                record(video_id, url, ProcessingResult(
+                    success=False, video_id=video_id, error=str(e)
+                ))
+
+    def summarizer() -> None:
+        while True:
+            item = summarize_queue.get()
+            if item is None or stop.is_set():
+                return
+            video_id, url, segments, transcript_tokens = item
+            try:
+                result = process_transcript(
+                    url=url,
+                    video_id=video_id,
+                    segments=segments,
+                    use_cache=use_cache,
+                    **process_options
+                )
+            except Exception as e:
+                result = ProcessingResult(success=False, video_id=video_id, error=str(e))
+            record(video_id, url, result, transcript_tokens)
+
+    started = time.perf_counter()
+    fetchers = [threading.Thread(target=fetcher, daemon=True) for _ in range(fetch_workers)]
+    summarizers = [threading.Thread(target=summarizer, daemon=True) for _ in range(summarize_workers)]
+    for thread in fetchers + summarizers:
+        thread.start()
+    try:
+        for thread in fetchers:
+            thread.join()
+        for _ in summarizers:
+            summarize_queue.put(None)
+        for thread in summarizers:
+            thread.join()
+    finally:
+        report.elapsed = time.perf_counter() - started
+        # After an interrupt the daemon workers may still be running - stop
+        # them under the lock so none writes to the closed checkpoint
+        with lock:
+            stop.set()
+            if checkpoint is not None:
+                checkpoint.close()
+
+    return report
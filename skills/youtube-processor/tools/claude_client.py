@@ -0,0 +1,145 @@
+"""
+Claude Client
+One pooled Anthropic client per API key, shared by every summarization
+call in the process - CLI batch runs, map-reduce chunks and the API alike.
+
+Reusing the client keeps its HTTP connections alive, so only the first
+call pays for the TLS handshake. Calls retry 429 (rate limited) and 529
+(overloaded) responses with exponential backoff, and a process-wide
+semaphore caps how many requests are in flight at once.
+
+The anthropic SDK (and httpx) is imported when the first client is
+created, so transcript-only work through youtube_core never loads it.
+"""
+
+import os
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, TypeVar
+
+if TYPE_CHECKING:
+    import anthropic
+
+T = TypeVar("T")
+
+MAX_RETRIES = int(os.environ.get("ANTHROPIC_MAX_RETRIES", "5"))
+BACKOFF_BASE = float(os.environ.get("ANTHROPIC_BACKOFF_BASE", "1.0"))
+BACKOFF_MAX = float(os.environ.get("ANTHROPIC_BACKOFF_MAX", "30.0"))
+MAX_CONCURRENCY = int(os.environ.get("ANTHROPIC_MAX_CONCURRENCY", "8"))
+REQUEST_TIMEOUT = float(os.environ.get("ANTHROPIC_TIMEOUT", "300"))
+
+RETRYABLE_STATUS = (429, 529)
+
+_clients: Dict[str, "anthropic.Anthropic"] = {}
+_clients_lock = threading.Lock()
+_in_flight = threading.BoundedSemaphore(MAX_CONCURRENCY)
+
+
+def get_client(api_key: Optional[str] = None) -> "anthropic.Anthropic":
+    """
+    Return the shared client for this API key, creating it on first use.
+
+    Args:
+        api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+
+    Raises:
+        ValueError: If no API key is available
+    """
+    key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+    if not key:
+        raise ValueError("ANTHROPIC_API_KEY not set")
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            import anthropic
+            import httpx
+
+            client = anthropic.Anthropic(
+                api_key=key,
+                # Retries are handled here so backoff is configurable
+                max_retries=0,
+                timeout=REQUEST_TIMEOUT,
+                http_client=anthropic.DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONCURRENCY * 2,
+                        max_keepalive_connections=MAX_CONCURRENCY,
+                        keepalive_expiry=60
+                    )
+                )
+            )
+            _clients[key] = client
+    return client
+
+
+def _api_status_error() -> Any:
+    # Only reached once a client exists, so the SDK is already loaded
+    import anthropic
+    return anthropic.APIStatusError
+
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(error, _api_status_error()) and error.status_code in RETRYABLE_STATUS
+
+
+def _backoff(attempt: int, error: Exception) -> float:
+    """Seconds to wait before retry `attempt` - honours Retry-After."""
+    retry_after = error.response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX)
+        except ValueError:
+            pass
+    delay = BACKOFF_BASE * (2 ** attempt)
+    return min(delay, BACKOFF_MAX) * random.uniform(0.5, 1.0)
+
+
+def call_with_retries(call: Callable[[], T]) -> T:
+    """
+    Run one API call under the concurrency limit, retrying 429/529.
+    """
+    attempt = 0
+    while True:
+        try:
+            with _in_flight:
+                return call()
+        except Exception as e:
+            if not _is_retryable(e) or attempt >= MAX_RETRIES:
+                raise
+            time.sleep(_backoff(attempt, e))
+            attempt += 1
+
+
+def stream_with_retries(open_stream: Callable[[], "anthropic.MessageStreamManager"]) -> Iterator[str]:
+    """
+    Yield text deltas from a streaming call under the concurrency limit.
+
+    429/529 are only retried before the first delta - once text has been
+    handed to the caller a restart would duplicate it.
+
+    The concurrency slot is held while the caller consumes deltas. A
+    caller that stops early (an SSE client disconnected, say) must
+    close() the generator - `with contextlib.closing(...)` - so the
+    stream is closed and the slot released right away rather than
+    whenever the generator is garbage collected.
+    """
+    attempt = 0
+    while True:
+        started = False
+        _in_flight.acquire()
+        try:
+            with open_stream() as stream:
+                for text in stream.text_stream:
+                    started = True
+                    yield text
+            return
+        except Exception as e:
+            if started or not _is_retryable(e) or attempt >= MAX_RETRIES:
+                raise
+            error = e
+        finally:
+            # Runs on close() too (GeneratorExit at the yield)
+            _in_flight.release()
+        time.sleep(_backoff(attempt, error))
+        attempt += 1
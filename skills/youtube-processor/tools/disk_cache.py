@@ -0,0 +1,243 @@
+"""
+Disk Cache
+Small SQLite-backed key/value store with TTL and size-bounded LRU eviction.
+Shared by the CLI tools and the FastAPI service so a transcript is only
+fetched from YouTube once, and a summary only generated once, no matter
+which entry point asked for it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+# Transcripts almost never change once published
+DEFAULT_TTL = 30 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+def default_cache_dir() -> str:
+    """
+    Where cache databases live.
+
+    YOUTUBE_PROCESSOR_CACHE_DIR wins if set. On Vercel only /tmp is
+    writable, so fall back to the temp dir there; otherwise ~/.cache.
+    """
+    configured = os.environ.get("YOUTUBE_PROCESSOR_CACHE_DIR")
+    if configured:
+        return configured
+    if os.environ.get("VERCEL"):
+        return os.path.join(tempfile.gettempdir(), "youtube-processor")
+    return os.path.join(os.path.expanduser("~"), ".cache", "youtube-processor")
+
+
+def cache_enabled() -> bool:
+    """Caching is on unless YOUTUBE_PROCESSOR_CACHE is set to 0/false/off."""
+    value = os.environ.get("YOUTUBE_PROCESSOR_CACHE", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+class DiskCache:
+    """
+    Persistent JSON value cache stored in a single SQLite file.
+
+    Entries expire after `ttl` seconds. When the stored payload grows past
+    `max_bytes`, the least recently used entries are evicted first.
+    Any SQLite failure is treated as a cache miss - the cache must never
+    be the reason a transcript request fails.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for `key`, or None if missing or expired."""
+        value = self._lookup(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value, created_at = row
+                if now - created_at > self.ttl:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                conn.commit()
+            return json.loads(value)
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serialisable value, evicting old entries if needed."""
+        payload = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now, now)
+                )
+                self._evict(conn, now)
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl,))
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        # Drop least recently used entries until we're back under budget
+        excess = total - self.max_bytes
+        stale = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        ):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process, plus what's on disk."""
+        entries, size = 0, 0
+        try:
+            with self._lock:
+                entries, size = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            pass
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "bytes": size
+        }
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM entries")
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+
+_caches: Dict[str, DiskCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _named_cache(name: str, **kwargs) -> Optional[DiskCache]:
+    if not cache_enabled():
+        return None
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = DiskCache(
+                os.path.join(default_cache_dir(), f"{name}.db"), **kwargs
+            )
+        return _caches[name]
+
+
+def transcript_cache() -> Optional[DiskCache]:
+    """The shared transcript cache, or None when caching is disabled."""
+    return _named_cache("transcripts")
+
+
+def summary_cache() -> Optional[DiskCache]:
+    """The shared summary cache, or None when caching is disabled."""
+    return _named_cache("summaries", max_bytes=50 * 1024 * 1024)
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every cache opened in this process, keyed by name."""
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+def summary_key(transcript: str, prompt: str, model: str, max_tokens: int) -> str:
+    """
+    Cache key for a summary: a hash of everything that shapes the output.
+    Changing the prompt template or model naturally invalidates old entries.
+    """
+    digest = hashlib.sha256()
+    for part in (model, str(max_tokens), prompt, transcript):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def transcript_key(video_id: str, language: str = "en", normalized: bool = False) -> str:
+    """Cache key for a transcript; verbatim and cleaned copies are kept apart."""
+    return f"{video_id}:{language}:{'clean' if normalized else 'raw'}"
+
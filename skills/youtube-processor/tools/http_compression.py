@@ -0,0 +1,206 @@
+"""
+HTTP Compression
+ASGI middleware that compresses responses with brotli or gzip, whichever
+the client prefers and we support.
+
+Transcripts are large, repetitive text - they shrink 3-5x - and they go
+to phones over Vercel bandwidth. Brotli is used when the optional
+`brotli` package is installed and the client asks for it; gzip (stdlib
+zlib) otherwise. Streaming responses such as the NDJSON batch endpoint
+are compressed chunk by chunk and flushed, so each line still reaches
+the client as soon as it's written.
+
+Starlette's GZipMiddleware only does gzip; this keeps one code path for
+both encodings. A strong ETag on a compressed response gets a "-gzip" /
+"-br" suffix, since the compressed bytes are a different representation.
+A 304 must carry the validator its 200 would have, so 304s get the same
+suffix - and compressible responses with a strong ETag are compressed
+whatever their size, so that suffix never depends on the body length.
+"""
+
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+# Below this a response isn't worth compressing (headers cost more)
+MINIMUM_SIZE = 500
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+)
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Encodings this process can produce, best first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick a content-coding from an Accept-Encoding header.
+
+    Honours q-values (q=0 refuses an encoding); ties go to our own
+    preference order, brotli first.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _tag_etag(etag: bytes, encoding: str) -> bytes:
+    """'"abc"' -> '"abc-gzip"'; weak ETags are left alone."""
+    if etag.startswith(b'"') and etag.endswith(b'"'):
+        return etag[:-1] + b"-" + encoding.encode("ascii") + b'"'
+    return etag
+
+
+def _tagged_headers(start: Dict[str, Any], encoding: str) -> List[Tuple[bytes, bytes]]:
+    """Response headers with the ETag tagged for `encoding` and Vary set."""
+    headers = [
+        (k, _tag_etag(v, encoding) if k.lower() == b"etag" else v)
+        for k, v in start.get("headers", [])
+    ]
+    vary = [v for k, v in headers if k.lower() == b"vary"]
+    if not any(b"accept-encoding" in v.lower() for v in vary):
+        headers.append((b"vary", b"Accept-Encoding"))
+    return headers
+
+
+class _Compressor:
+    """Incremental compressor with a flush per streamed chunk."""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            # wbits=31: gzip container
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """
+    Negotiated brotli/gzip for compressible responses.
+
+        app.add_middleware(CompressionMiddleware)
+
+    Responses that already carry a Content-Encoding, aren't text/JSON,
+    or are smaller than `minimum_size` (and have no strong ETag) pass
+    through untouched. Only send strong ETags on compressible responses:
+    a 304's ETag is tagged on the assumption its 200 was compressed.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        minimum_size: int = MINIMUM_SIZE,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality}
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Dict[str, Any]] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def compressing_send(message: Dict[str, Any]) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                if message["status"] == 304:
+                    # Same validator the compressed 200 carries
+                    passthrough = True
+                    await send({**message, "headers": _tagged_headers(message, encoding)})
+                    return
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers: List[Tuple[bytes, bytes]] = list(start.get("headers", []))
+                names = {key.lower() for key, _ in headers}
+                content_type = next(
+                    (value.decode("latin-1") for key, value in headers if key.lower() == b"content-type"),
+                    ""
+                )
+                strong_etag = any(
+                    key.lower() == b"etag" and value.startswith(b'"')
+                    for key, value in headers
+                )
+                if (
+                    b"content-encoding" in names
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and not strong_etag and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.levels[encoding])
+                headers = [
+                    (k, v) for k, v in _tagged_headers(start, encoding)
+                    if k.lower() != b"content-length"
+                ]
+                headers.append((b"content-encoding", encoding.encode("ascii")))
+                await send({**start, "headers": headers})
+
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, final=not more_body),
+                "more_body": more_body
+            })
+
+        await self.app(scope, receive, compressing_send)
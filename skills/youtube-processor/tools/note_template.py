@@ -0,0 +1,90 @@
+"""
+Note Template
+Precompiled markdown templates rendered as a stream of chunks.
+
+format_for_obsidian used to build the whole note as one f-string, so a
+3-hour transcript was held in memory again inside the markdown (and
+again in ProcessingResult.markdown_output). A NoteTemplate parses its
+`{field}` placeholders once at import time; rendering just yields the
+literal pieces and field values in order, so a note can be written
+straight to a file or response without ever being joined:
+
+    NOTE = NoteTemplate("# {title}\\n\\n{body}\\n", volatile=())
+    NOTE.write(f, title="Hi", body=transcript)
+
+Fields listed as `volatile` (timestamps) are flagged in iter_chunks so
+the vault index can hash a note without them. `bind(**values)` gives a
+note that can be iterated more than once - the vault index hashes it
+first and only writes it if it changed.
+"""
+
+from string import Formatter
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple
+
+
+class NoteTemplate:
+    """A str.format-style template compiled to (literal, field) parts."""
+
+    def __init__(self, source: str, volatile: Iterable[str] = ("timestamp",)):
+        """
+        Args:
+            source: Template text with {field} placeholders ({{ }} escapes)
+            volatile: Fields whose values change on every render
+        """
+        self.volatile = frozenset(volatile)
+        self._parts: List[Tuple[str, str]] = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if spec or conversion:
+                raise ValueError(f"Format specs and conversions aren't supported: {{{field}}}")
+            if field is not None and not field.isidentifier():
+                raise ValueError(f"Placeholder must be a plain name: {{{field}}}")
+            self._parts.append((literal, field))
+        self.fields = frozenset(field for _, field in self._parts if field)
+
+    def iter_chunks(self, **values: Any) -> Iterator[Tuple[str, bool]]:
+        """
+        Yield (text, is_volatile) pieces of the rendered note.
+
+        Values are passed through str() but never concatenated, so a long
+        transcript is yielded as the same string object it came in as.
+        """
+        missing = self.fields - values.keys()
+        if missing:
+            raise KeyError(f"Missing template fields: {', '.join(sorted(missing))}")
+        for literal, field in self._parts:
+            if literal:
+                yield literal, False
+            if field:
+                yield str(values[field]), field in self.volatile
+
+    def bind(self, **values: Any) -> "BoundNote":
+        """This template with its values: re-iterable (text, is_volatile) chunks."""
+        missing = self.fields - values.keys()
+        if missing:
+            raise KeyError(f"Missing template fields: {', '.join(sorted(missing))}")
+        return BoundNote(self, values)
+
+    def iter_render(self, **values: Any) -> Iterator[str]:
+        """Yield the rendered note piece by piece."""
+        for text, _ in self.iter_chunks(**values):
+            yield text
+
+    def write(self, f: TextIO, **values: Any) -> None:
+        """Render straight into an open text file."""
+        for text, _ in self.iter_chunks(**values):
+            f.write(text)
+
+    def render(self, **values: Any) -> str:
+        """The whole note as one string, for callers that need it."""
+        return "".join(self.iter_render(**values))
+
+
+class BoundNote:
+    """A NoteTemplate plus values; each iteration renders the chunks afresh."""
+
+    def __init__(self, template: NoteTemplate, values: Dict[str, Any]):
+        self.template = template
+        self.values = values
+
+    def __iter__(self) -> Iterator[Tuple[str, bool]]:
+        return self.template.iter_chunks(**self.values)
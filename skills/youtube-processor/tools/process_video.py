@@ -5,17 +5,30 @@ Command-line interface for the youtube-processor skill.
 
 Usage:
     python process_video.py --url "https://youtube.com/watch?v=..." [options]
+    python process_video.py --playlist "https://youtube.com/playlist?list=..." --save
+    python process_video.py --channel @handle --save --checkpoint backfill.jsonl
 
 Options:
-    --url           YouTube video URL (required)
-    --type          Summary type: brief, detailed, bullets, newsletter (default: detailed)
+    --url           YouTube video URL
+    --playlist      Process every video in a playlist (needs yt-dlp)
+    --channel       Process every upload on a channel URL or @handle (needs yt-dlp)
+    --urls-file     Process every URL in a text file (one per line)
+    --checkpoint    Resume file for batch runs (default: batch-checkpoint.jsonl)
+    --type          Summary type: brief, detailed, bullets, newsletter, all (default: detailed)
     --save          Save to Obsidian vault
     --vault         Custom vault path (default: Ed's Zettelkasten)
+    --skip-existing With --save, do nothing if the video already has a note
     --transcript    Only extract transcript, no summary
     --json          Output as JSON
+    --no-transcript Leave the full transcript out of the output (saved notes keep it)
+    --no-cache      Ignore the local transcript and summary caches
+    --cache-stats   Print cache hit/miss counters to stderr when done
+    --map-reduce    Summarize in parallel chunks (automatic for very long videos)
+    --chunk-tokens  Token budget per chunk in map-reduce mode (default: 8000)
 """
 
 import argparse
+import atexit
 import json
 import sys
 import os
@@ -27,24 +40,110 @@ from youtube_core import (
     process_video,
     extract_video_id,
     get_transcript,
-    ProcessingResult
+    ProcessingResult,
+    SUMMARY_PROMPTS,
+    CHUNK_TOKEN_BUDGET,
+    MIN_CHUNK_TOKENS
 )
+from disk_cache import cache_stats
+from vault_index import vault_index
+from batch import run_batch, read_urls_file, expand_playlist, expand_channel
+
+
+def chunk_tokens(value: str) -> int:
+    """--chunk-tokens: chunks smaller than a chunk's notes never converge."""
+    tokens = int(value)
+    if tokens < MIN_CHUNK_TOKENS:
+        raise argparse.ArgumentTypeError(f"must be at least {MIN_CHUNK_TOKENS}")
+    return tokens
+
+
+def run_batch_mode(args) -> None:
+    """Playlist / channel / URL-file processing with a resumable checkpoint."""
+    try:
+        if args.urls_file:
+            urls = read_urls_file(args.urls_file)
+        elif args.playlist:
+            urls = expand_playlist(args.playlist)
+        else:
+            urls = expand_channel(args.channel)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Found {len(urls)} videos", file=sys.stderr)
+    finished = []
+
+    def show(result: ProcessingResult) -> None:
+        finished.append(result)
+        mark = "ok" if result.success else f"FAILED: {result.error}"
+        print(f"[{len(finished)}] {result.video_id} {mark}", file=sys.stderr)
+        if result.success and not args.json and not result.saved_to:
+            print(f"\n--- {result.video_id} ---\n")
+            print(result.summary)
+
+    report = run_batch(
+        urls,
+        checkpoint_path=args.checkpoint,
+        fetch_workers=args.fetch_workers,
+        summarize_workers=args.summarize_workers,
+        use_cache=not args.no_cache,
+        on_result=show,
+        summary_type=args.type if args.type != "all" else "detailed",
+        summary_types=list(SUMMARY_PROMPTS) if args.type == "all" else None,
+        save_to_vault=args.save,
+        vault_path=args.vault,
+        map_reduce=args.map_reduce,
+        max_chunk_tokens=args.chunk_tokens,
+        include_transcript=not args.no_transcript,
+        # Batch output never shows markdown_output
+        build_markdown=False
+    )
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(f"\n--- BATCH REPORT ---", file=sys.stderr)
+        print(
+            f"{report.processed} processed, {report.skipped} skipped (checkpoint), "
+            f"{report.failed} failed of {report.total}",
+            file=sys.stderr
+        )
+        print(
+            f"{report.elapsed:.1f}s - {report.videos_per_min} videos/min, "
+            f"~{report.tokens_per_sec} tokens/sec",
+            file=sys.stderr
+        )
+    if report.failed:
+        sys.exit(1)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Process YouTube videos into summaries and Obsidian notes"
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--url", "-u",
-        required=True,
         help="YouTube video URL"
     )
+    source.add_argument(
+        "--playlist",
+        help="YouTube playlist URL (batch mode)"
+    )
+    source.add_argument(
+        "--channel",
+        help="YouTube channel URL or @handle (batch mode)"
+    )
+    source.add_argument(
+        "--urls-file",
+        help="Text file with one YouTube URL per line (batch mode)"
+    )
     parser.add_argument(
         "--type", "-t",
         default="detailed",
-        choices=["brief", "detailed", "bullets", "newsletter"],
-        help="Summary type (default: detailed)"
+        choices=list(SUMMARY_PROMPTS) + ["all"],
+        help="Summary type, or 'all' for every type from one fetch (default: detailed)"
     )
     parser.add_argument(
         "--save", "-s",
@@ -56,6 +155,11 @@ def main():
         default="/Users/eddale/Documents/COPYobsidian/MAGI/Zettelkasten",
         help="Path to Obsidian vault"
     )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="With --save: skip videos that already have a note in the vault"
+    )
     parser.add_argument(
         "--transcript-only",
         action="store_true",
@@ -66,14 +170,69 @@ def main():
         action="store_true",
         help="Output as JSON"
     )
+    parser.add_argument(
+        "--no-transcript",
+        action="store_true",
+        help="Leave the full transcript out of the output (a saved note keeps it)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the local transcript and summary caches"
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print cache hit/miss counters to stderr"
+    )
+
+    parser.add_argument(
+        "--map-reduce",
+        action="store_true",
+        default=None,
+        help="Force chunked map-reduce summarization (auto for long transcripts)"
+    )
+    parser.add_argument(
+        "--chunk-tokens",
+        type=chunk_tokens,
+        default=CHUNK_TOKEN_BUDGET,
+        help=f"Token budget per chunk in map-reduce mode (default: {CHUNK_TOKEN_BUDGET}, min: {MIN_CHUNK_TOKENS})"
+    )
+
+    parser.add_argument(
+        "--checkpoint",
+        default="batch-checkpoint.jsonl",
+        help="Batch mode: JSON-lines resume file (default: batch-checkpoint.jsonl)"
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=4,
+        help="Batch mode: concurrent transcript fetches (default: 4)"
+    )
+    parser.add_argument(
+        "--summarize-workers",
+        type=int,
+        default=4,
+        help="Batch mode: concurrent summaries (default: 4)"
+    )
 
     args = parser.parse_args()
 
+    if args.cache_stats:
+        atexit.register(
+            lambda: print(json.dumps(cache_stats(), indent=2), file=sys.stderr)
+        )
+
+    if not args.url:
+        run_batch_mode(args)
+        return
+
     # Transcript-only mode
     if args.transcript_only:
         try:
             video_id = extract_video_id(args.url)
-            transcript, lang = get_transcript(video_id)
+            transcript, lang = get_transcript(video_id, use_cache=not args.no_cache)
 
             if args.json:
                 print(json.dumps({
@@ -96,12 +255,49 @@ def main():
             sys.exit(1)
         return
 
+    # Already in the vault? One index lookup, no fetch or summary
+    if args.save and args.skip_existing and os.path.isdir(args.vault):
+        try:
+            existing = vault_index(args.vault).get(extract_video_id(args.url))
+        except ValueError:
+            existing = None
+        if existing:
+            if args.json:
+                print(json.dumps({
+                    "success": True,
+                    "video_id": existing["video_id"],
+                    "skipped": True,
+                    "saved_to": existing["path"]
+                }, indent=2))
+            else:
+                print(f"Already processed: {existing['path']}")
+            return
+
+    # Stream the summary to the terminal as it's generated
+    streamed = []
+
+    def print_delta(text: str) -> None:
+        if not streamed:
+            print(f"Video ID: {extract_video_id(args.url)}")
+            print(f"\n--- SUMMARY ---\n")
+            streamed.append(True)
+        print(text, end="", flush=True)
+
+    stream_output = not args.json and args.type != "all"
+
     # Full processing
     result = process_video(
         url=args.url,
         summary_type=args.type,
         save_to_vault=args.save,
-        vault_path=args.vault
+        vault_path=args.vault,
+        use_cache=not args.no_cache,
+        summary_types=list(SUMMARY_PROMPTS) if args.type == "all" else None,
+        on_delta=print_delta if stream_output else None,
+        map_reduce=args.map_reduce,
+        max_chunk_tokens=args.chunk_tokens,
+        include_transcript=not args.no_transcript,
+        build_markdown=args.json
     )
 
     if args.json:
@@ -109,20 +305,34 @@ def main():
             "success": result.success,
             "video_id": result.video_id,
             "summary": result.summary,
+            "summaries": result.summaries,
+            "timings": result.timings,
             "markdown_output": result.markdown_output,
             "saved_to": result.saved_to,
             "error": result.error
         }, indent=2))
     else:
         if result.success:
-            print(f"Video ID: {result.video_id}")
-            print(f"\n--- SUMMARY ---\n")
-            print(result.summary)
+            if streamed:
+                # Summary is already on screen
+                print()
+            else:
+                print(f"Video ID: {result.video_id}")
+                if result.summaries:
+                    for summary_type, summary in result.summaries.items():
+                        elapsed = result.timings.get(summary_type, 0.0)
+                        print(f"\n--- {summary_type.upper()} ({elapsed:.1f}s) ---\n")
+                        print(summary)
+                else:
+                    print(f"\n--- SUMMARY ---\n")
+                    print(result.summary)
 
             if result.saved_to:
                 print(f"\n--- SAVED TO ---")
                 print(result.saved_to)
         else:
+            if streamed:
+                print()
             print(f"Error: {result.error}", file=sys.stderr)
             sys.exit(1)
 
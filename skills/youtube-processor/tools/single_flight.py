@@ -0,0 +1,132 @@
+"""
+Single Flight
+Coalesces concurrent identical calls so only one of them does the work.
+
+When several Shortcuts or browser tabs submit the same video at once,
+each request used to run its own transcript fetch and Claude summary.
+Wrapping that work in a SingleFlight keyed by video_id (plus summary
+type for summaries) makes later callers wait on the first caller's
+result instead. Only calls that overlap in time are merged - once a call
+finishes, the next one runs fresh (the disk cache handles reuse after that).
+
+Exceptions are shared too: if the leader fails, everyone waiting on it
+gets the same error.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """
+    Per-key call coalescing, usable from threads and from asyncio.
+
+        flight = SingleFlight()
+        text, lang = flight.do(video_id, lambda: get_transcript(video_id))
+
+    `do` blocks the calling thread; `do_async` awaits without tying up
+    a worker thread for followers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._async_calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` unless a call for `key` is already in flight, in which
+        case wait for that call and return (or raise) its outcome.
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                leader = False
+            else:
+                future = Future()
+                self._calls[key] = future
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+    async def do_async(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        executor: Optional[Executor] = None
+    ) -> Any:
+        """
+        Async variant of `do`: the leader runs blocking `fn` on `executor`
+        and followers await the same future.
+
+        A follower being cancelled (client disconnected) doesn't cancel the
+        shared call; the other waiters still get their result.
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._async_calls.get(key)
+            if future is not None:
+                self.shared += 1
+            else:
+                future = asyncio.get_running_loop().run_in_executor(executor, fn)
+                self._async_calls[key] = future
+                self.executions += 1
+                future.add_done_callback(lambda _: self._forget(key, future))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        with self._lock:
+            if self._async_calls.get(key) is future:
+                del self._async_calls[key]
+        # Nobody may be left to await a failed call - mark it retrieved
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """How many calls ran, and how many were absorbed by one in flight."""
+        with self._lock:
+            in_flight = len(self._calls) + len(self._async_calls)
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "shared": self.shared,
+            "shared_rate": round(self.shared / self.calls, 3) if self.calls else 0.0,
+            "in_flight": in_flight
+        }
+
+
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def single_flight(name: str) -> SingleFlight:
+    """The process-wide SingleFlight registered under `name`."""
+    with _flights_lock:
+        if name not in _flights:
+            _flights[name] = SingleFlight()
+        return _flights[name]
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every SingleFlight created in this process, keyed by name."""
+    with _flights_lock:
+        flights = dict(_flights)
+    return {name: flight.stats() for name, flight in flights.items()}
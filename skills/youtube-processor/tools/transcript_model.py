@@ -0,0 +1,162 @@
+"""
+Transcript Model
+Compact, segment-preserving transcript representation.
+
+youtube-transcript-api hands back one Python object per caption segment -
+thousands for a long podcast. We keep the timing data instead of throwing
+it away, but store it as flat arrays plus a single text buffer:
+
+    text       "never gonna give you up never gonna let you down ..."
+    bounds     [0, 24, ...]        segment i is text[bounds[i]:bounds[i+1] - 1]
+    starts     [0.0, 2.1, ...]     seconds
+    durations  [2.1, 1.9, ...]     seconds
+
+`transcript.text` is the joined transcript itself - no copy is made when
+callers only need the flat string.
+"""
+
+import base64
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Transcript:
+    """Caption segments backed by parallel arrays and one text buffer."""
+
+    __slots__ = ("text", "language", "bounds", "starts", "durations")
+
+    def __init__(
+        self,
+        text: str,
+        language: str,
+        bounds: array,
+        starts: array,
+        durations: array
+    ):
+        self.text = text
+        self.language = language
+        self.bounds = bounds
+        self.starts = starts
+        self.durations = durations
+
+    @classmethod
+    def from_snippets(
+        cls,
+        snippets: Iterable[Any],
+        language: str,
+        clean: Optional[Callable[[str], str]] = None
+    ) -> "Transcript":
+        """
+        Build from youtube-transcript-api snippets (anything with
+        .text, .start and .duration). Segments are joined with one space.
+
+        `clean` is applied to each segment's text; segments it leaves
+        empty (a lone [Music], say) are dropped.
+        """
+        parts = []
+        bounds = array("I", [0])
+        starts = array("d")
+        durations = array("d")
+        position = 0
+        for snippet in snippets:
+            text = snippet.text
+            if clean is not None:
+                text = clean(text)
+                if not text:
+                    continue
+            parts.append(text)
+            position += len(text) + 1
+            bounds.append(position)
+            starts.append(snippet.start)
+            durations.append(snippet.duration)
+        return cls(" ".join(parts), language, bounds, starts, durations)
+
+    @classmethod
+    def from_text(cls, text: str, language: str) -> "Transcript":
+        """Wrap a flat string with no timing data as a single segment."""
+        return cls(
+            text,
+            language,
+            array("I", [0, len(text) + 1]),
+            array("d", [0.0]),
+            array("d", [0.0])
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def segment(self, index: int) -> Tuple[float, float, str]:
+        """(start, duration, text) for one segment."""
+        text = self.text[self.bounds[index]:self.bounds[index + 1] - 1]
+        return self.starts[index], self.durations[index], text
+
+    def __iter__(self) -> Iterator[Tuple[float, float, str]]:
+        for index in range(len(self)):
+            yield self.segment(index)
+
+    def slice(self, start: int, stop: int) -> "Transcript":
+        """Segments [start, stop) as a new Transcript with rebased offsets."""
+        stop = min(stop, len(self))
+        lo = self.bounds[start]
+        hi = self.bounds[stop]
+        return Transcript(
+            self.text[lo:max(lo, hi - 1)],
+            self.language,
+            array("I", (b - lo for b in self.bounds[start:stop + 1])),
+            self.starts[start:stop],
+            self.durations[start:stop]
+        )
+
+    def chunk_ranges(self, max_chars: int) -> List[Tuple[int, int]]:
+        """
+        Group consecutive segments into [start, stop) ranges whose text
+        stays under max_chars. A single oversized segment gets its own range.
+        """
+        ranges = []
+        start = 0
+        for index in range(1, len(self) + 1):
+            if self.bounds[index] - self.bounds[start] > max_chars and index - 1 > start:
+                ranges.append((start, index - 1))
+                start = index - 1
+        if start < len(self):
+            ranges.append((start, len(self)))
+        return ranges
+
+    def chunk_texts(self, max_chars: int) -> List[str]:
+        """Chunk text split on segment boundaries - one slice per chunk."""
+        return [
+            self.text[self.bounds[start]:self.bounds[stop] - 1]
+            for start, stop in self.chunk_ranges(max_chars)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-friendly form for the disk cache. Keeps the "text" and
+        "language" keys readers of the plain (text, language) cache expect.
+        """
+        return {
+            "text": self.text,
+            "language": self.language,
+            "bounds": base64.b64encode(self.bounds.tobytes()).decode("ascii"),
+            "starts": base64.b64encode(self.starts.tobytes()).decode("ascii"),
+            "durations": base64.b64encode(self.durations.tobytes()).decode("ascii")
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Transcript":
+        """Inverse of to_dict. Entries without timing data become one segment."""
+        if "bounds" not in data:
+            return cls.from_text(data["text"], data["language"])
+
+        def unpack(typecode: str, encoded: str) -> array:
+            values = array(typecode)
+            values.frombytes(base64.b64decode(encoded))
+            return values
+
+        return cls(
+            data["text"],
+            data["language"],
+            unpack("I", data["bounds"]),
+            unpack("d", data["starts"]),
+            unpack("d", data["durations"])
+        )
@@ -0,0 +1,138 @@
+"""
+Transcript Source
+One list call and one fetch call per video, with the language choice
+shared by every caller.
+
+`YouTubeTranscriptApi.fetch()` lists a video's tracks internally, so the
+old "fetch English, on failure list and fetch something else" pattern
+listed twice for non-English videos, and the research extractor listed
+a second time just to report the available tracks. Here the track list
+is fetched once and reused to pick the track and describe the rest.
+
+fetch_transcript_model is the fetch behind the shared transcript cache.
+Caption text is verbatim unless the caller asks for it cleaned with
+TRANSCRIPT_NORMALIZER (summaries do; the API and get_transcript.py only
+on request). Raw and cleaned copies are cached under separate keys, so
+whichever entry point fetched first never decides the other's text.
+
+youtube-transcript-api (and requests under it) is imported on the first
+fetch rather than at import time, keeping it off serverless cold starts.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from text_normalizer import normalize_text
+from transcript_model import Transcript
+
+DEFAULT_LANGUAGES = ("en",)
+
+# Applied to every caption segment fetched with normalize=True. Swap in
+# a text_normalizer.TextNormalizer(...) to change what gets cleaned.
+TRANSCRIPT_NORMALIZER: Optional[Callable[[str], str]] = normalize_text
+
+# Set on first use by api_class(); tests and benchmarks may assign a stand-in
+YouTubeTranscriptApi = None
+
+
+def api_class() -> Any:
+    """The YouTubeTranscriptApi class, importing the library on first call."""
+    global YouTubeTranscriptApi
+    if YouTubeTranscriptApi is None:
+        from youtube_transcript_api import YouTubeTranscriptApi as library_api
+        YouTubeTranscriptApi = library_api
+    return YouTubeTranscriptApi
+
+
+def select_transcript(
+    transcript_list: Any,
+    languages: Iterable[str] = DEFAULT_LANGUAGES,
+    any_language: bool = True
+) -> Any:
+    """
+    Pick the best track from a TranscriptList - no network calls.
+
+    Tries `languages` in order (manual captions before auto-generated for
+    each), then, if any_language is set, the first track available.
+
+    Raises:
+        NoTranscriptFound: If nothing matches
+    """
+    # Already loaded - we have a TranscriptList from it
+    from youtube_transcript_api._errors import NoTranscriptFound
+
+    try:
+        return transcript_list.find_transcript(list(languages))
+    except NoTranscriptFound as e:
+        if not any_language:
+            raise
+        missing = e
+
+    # Manual tracks come first when iterating
+    for transcript in transcript_list:
+        return transcript
+    raise missing
+
+
+def fetch_transcript_track(
+    video_id: str,
+    languages: Iterable[str] = DEFAULT_LANGUAGES,
+    any_language: bool = True,
+    api: Optional[Any] = None
+) -> Tuple[Any, Any, Any]:
+    """
+    List the video's tracks once, choose one and fetch it once.
+
+    Args:
+        video_id: YouTube video ID
+        languages: Preferred language codes, best first
+        any_language: Fall back to any track if none of `languages` exist
+        api: YouTubeTranscriptApi instance to reuse (a new one by default)
+
+    Returns:
+        (chosen track, fetched snippets, the TranscriptList)
+
+    Raises:
+        The library's errors (TranscriptsDisabled, NoTranscriptFound,
+        VideoUnavailable, ...) unchanged
+    """
+    api = api or api_class()()
+    transcript_list = api.list(video_id)
+    track = select_transcript(transcript_list, languages, any_language)
+    return track, track.fetch(), transcript_list
+
+
+def fetch_transcript_model(
+    video_id: str,
+    languages: Iterable[str] = DEFAULT_LANGUAGES,
+    any_language: bool = True,
+    api: Optional[Any] = None,
+    normalize: bool = False
+) -> Transcript:
+    """
+    fetch_transcript_track, as a Transcript.
+
+    Use this for anything stored in the shared transcript cache, keyed
+    with disk_cache.transcript_key(..., normalized=normalize).
+
+    Args:
+        normalize: Clean each segment with TRANSCRIPT_NORMALIZER
+            ([Music], curly quotes, whitespace) instead of keeping
+            captions verbatim
+
+    Other arguments and errors are as for fetch_transcript_track.
+    """
+    track, snippets, _ = fetch_transcript_track(video_id, languages, any_language, api)
+    clean = TRANSCRIPT_NORMALIZER if normalize else None
+    return Transcript.from_snippets(snippets, track.language_code, clean=clean)
+
+
+def describe_tracks(transcript_list: Any) -> List[Dict[str, Any]]:
+    """Language metadata for every track in an already-fetched list."""
+    return [
+        {
+            'language': t.language,
+            'language_code': t.language_code,
+            'is_generated': t.is_generated
+        }
+        for t in transcript_list
+    ]
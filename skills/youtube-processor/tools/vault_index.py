@@ -0,0 +1,314 @@
+"""
+Vault Index
+Idempotent note writer for the Obsidian vault, backed by a small index
+of processed videos.
+
+save_to_obsidian used to write a new dated file on every run, so
+re-processing a video duplicated its note and finding duplicates meant
+scanning the whole Zettelkasten. The index maps video_id -> (note path,
+content hash) and lives in the vault as one JSON-lines file:
+
+    <vault>/.youtube-processor/index.jsonl
+
+Each write appends one line (the last line for a video wins), and the
+file is rewritten compacted once stale lines outnumber live ones. Another
+process (the CLI and the API, say) may write the same index, so every
+lookup re-reads it if its mtime, size or inode changed, and a write holds
+a lock file from that re-read through to its append or compaction. With
+it, "already processed?" is a dict lookup, and writes become upserts:
+
+    - same content as the indexed note   -> nothing written
+    - content changed                    -> the existing note is replaced
+    - note edited by hand in the vault   -> left alone; the new version
+                                            goes beside it as
+                                            "<name> (regenerated).md"
+    - new video, or its note was deleted -> a new note is created
+
+Note files are replaced atomically (temp file + rename), so Obsidian or
+a sync client never sees a half-written note. Notes can be passed as
+NoteTemplate chunks and are then streamed to disk without ever being
+held in memory as one string; a NoteTemplate.bind(...) note is hashed
+before anything is written, so an unchanged note costs no disk writes.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking is per process only
+    fcntl = None
+
+# (text, is_volatile) pieces, as yielded by NoteTemplate.iter_chunks
+# (one pass) or a NoteTemplate.bind(...) note (re-iterable)
+NoteChunks = Iterable[Tuple[str, bool]]
+
+INDEX_DIR = ".youtube-processor"
+INDEX_FILE = "index.jsonl"
+LOCK_FILE = "index.lock"
+REGENERATED_SUFFIX = " (regenerated)"
+
+# Timestamps that change on every run without the note itself changing.
+# Only the value is dropped, so hashing a whole note and hashing its
+# non-volatile template chunks give the same digest.
+VOLATILE_LINES = re.compile(r"^(processed: |\*\*Processed\*\*: ).*$", re.MULTILINE)
+
+
+def content_hash(content: str) -> str:
+    """Hash of a note ignoring its processed-at timestamps."""
+    stable = VOLATILE_LINES.sub(r"\1", content)
+    return hashlib.sha256(stable.encode("utf-8")).hexdigest()
+
+
+def chunks_hash(chunks: NoteChunks) -> str:
+    """content_hash of a chunked note, without joining it."""
+    digest = hashlib.sha256()
+    for text, volatile in chunks:
+        if not volatile:
+            digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def file_hash(path: str) -> Optional[str]:
+    """content_hash of a note on disk, or None if it can't be read."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return content_hash(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_temp(path: str, chunks: NoteChunks) -> Tuple[str, str]:
+    """
+    Stream chunks to a temp file beside `path`, hashing as we go.
+
+    Returns:
+        (temp file path, content hash of the non-volatile chunks)
+    """
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for text, volatile in chunks:
+                f.write(text)
+                if not volatile:
+                    digest.update(text.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _discard(tmp_path)
+        raise
+    return tmp_path, digest.hexdigest()
+
+
+def _discard(tmp_path: str) -> None:
+    try:
+        os.unlink(tmp_path)
+    except OSError:
+        pass
+
+
+def atomic_write(path: str, content: str) -> None:
+    """Write `content` to `path` via a temp file in the same directory."""
+    tmp_path, _ = _write_temp(path, ((content, True),))
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
+class VaultIndex:
+    """
+    video_id -> note index for one vault, shared within a process and
+    re-read whenever the file changes underneath it.
+
+    Note paths are stored relative to the vault so the index survives
+    the vault being moved or synced to another machine.
+    """
+
+    def __init__(self, vault_path: str):
+        self.vault_path = vault_path
+        self.path = os.path.join(vault_path, INDEX_DIR, INDEX_FILE)
+        self.lock_path = os.path.join(vault_path, INDEX_DIR, LOCK_FILE)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lines = 0
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._load()
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _refresh(self) -> None:
+        """Re-read the index if another process changed it. Call with self._lock."""
+        if self._stat() != self._signature:
+            self._load()
+
+    def _load(self) -> None:
+        self._entries = {}
+        self._lines = 0
+        self._signature = self._stat()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Torn final line from a crash mid-append
+                        continue
+                    self._entries[entry["video_id"]] = entry
+        except FileNotFoundError:
+            pass
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Index entry for a video whose note still exists, else None.
+
+        Entry keys: video_id, path (absolute), hash, updated_at.
+        """
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(video_id)
+        if entry is None:
+            return None
+        path = os.path.join(self.vault_path, entry["path"])
+        if not os.path.exists(path):
+            return None
+        return {**entry, "path": path}
+
+    def is_processed(self, video_id: str) -> bool:
+        """Whether the video already has a note in this vault."""
+        return self.get(video_id) is not None
+
+    def write_note(
+        self,
+        video_id: str,
+        content: Union[str, NoteChunks],
+        filename: str
+    ) -> Tuple[str, bool]:
+        """
+        Upsert the note for `video_id`.
+
+        Args:
+            video_id: YouTube video ID
+            content: Full markdown note, or NoteTemplate.bind(...) /
+                .iter_chunks(...) to stream it to disk
+            filename: Name to use if the video has no note yet
+
+        If the indexed note was edited in the vault since we wrote it, it
+        is never overwritten: the new version is written beside it as
+        "<name> (regenerated).md" and the index keeps pointing at the
+        user's note.
+
+        Returns:
+            (path written - or the unchanged note's path, whether anything
+            was written)
+        """
+        with self._lock, self._file_lock():
+            # Before the existence check: another process may have
+            # written this video's note since we last looked
+            self._refresh()
+            entry = self._entries.get(video_id)
+            existing = None
+            if entry is not None:
+                existing = os.path.join(self.vault_path, entry["path"])
+                if not os.path.exists(existing):
+                    existing = None
+            path = existing or os.path.join(self.vault_path, filename)
+
+            # Strings and bound notes can be hashed before writing anything;
+            # a one-shot chunk iterator only once it has been streamed
+            digest = None
+            if isinstance(content, str):
+                digest = content_hash(content)
+            elif iter(content) is not content:
+                digest = chunks_hash(content)
+            if existing and entry["hash"] == digest:
+                return path, False
+
+            edited = existing is not None and file_hash(existing) != entry["hash"]
+            if edited:
+                stem, ext = os.path.splitext(existing)
+                path = stem + REGENERATED_SUFFIX + ext
+
+            if isinstance(content, str):
+                atomic_write(path, content)
+            else:
+                tmp_path, digest = _write_temp(path, content)
+                if existing and not edited and entry["hash"] == digest:
+                    _discard(tmp_path)
+                    return path, False
+                try:
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    _discard(tmp_path)
+                    raise
+
+            if edited:
+                return path, True
+            self._record({
+                "video_id": video_id,
+                "path": os.path.relpath(path, self.vault_path),
+                "hash": digest,
+                "updated_at": time.time()
+            })
+        return path, True
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock on the index file across processes."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _record(self, entry: Dict[str, Any]) -> None:
+        """Append (or compact in) one entry. Call with the file lock held."""
+        self._entries[entry["video_id"]] = entry
+        if self._lines >= 2 * len(self._entries) + 100:
+            self._compact()
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+        self._lines += 1
+        self._signature = self._stat()
+
+    def _compact(self) -> None:
+        """Rewrite the index one line per video. Call with the file lock held."""
+        atomic_write(self.path, "".join(
+            json.dumps(e) + "\n" for e in self._entries.values()
+        ))
+        self._lines = len(self._entries)
+        self._signature = self._stat()
+
+
+_indexes: Dict[str, VaultIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def vault_index(vault_path: str) -> VaultIndex:
+    """The shared index for `vault_path`, loaded on first use."""
+    key = os.path.realpath(vault_path)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = VaultIndex(vault_path)
+        return _indexes[key]
@@ -0,0 +1,103 @@
+"""
+Video URL Parsing
+One YouTube URL parser shared by the CLI tools, the transcript API and the
+prototype processor.
+
+Ordinary URLs are matched in one pass by a single precompiled pattern
+anchored on the host, so only real video locations match - channel,
+playlist and other non-video paths are rejected instead of yielding a
+bogus ID. Anything unusual (other subdomains, upper-case hosts, ports) falls
+back to urllib.parse, which accepts the same set of URLs, just slower.
+
+Handles:
+    youtube.com/watch?v=ID       (www., m., music., any query order)
+    youtu.be/ID
+    youtube.com/embed/ID, /v/ID, /e/ID, youtube-nocookie.com/embed/ID
+    youtube.com/shorts/ID, youtube.com/live/ID
+    a bare 11-character ID
+"""
+
+import re
+from urllib.parse import urlsplit
+
+VIDEO_ID_PATTERN = re.compile(r'[0-9A-Za-z_-]{11}')
+
+# Fast path: scheme, subdomains, host and the ID location in one match.
+# The ID is in whichever group matched (watch, path prefix or youtu.be).
+VIDEO_URL_PATTERN = re.compile(
+    r'(?:https?://)?(?:www\.|m\.|music\.)?'
+    r'(?:youtube(?:-nocookie)?\.com/'
+    r'(?:watch\?(?:[^#&]*&)*?v=([0-9A-Za-z_-]{11})(?=[&#]|$)'
+    r'|(?:embed|shorts|live|v|e)/([0-9A-Za-z_-]{11})(?=[/?#]|$))'
+    r'|youtu\.be/([0-9A-Za-z_-]{11})(?=[/?#]|$))'
+)
+
+# Path prefixes that are followed directly by a video ID
+_ID_PATH_PREFIXES = frozenset(("embed", "shorts", "live", "v", "e"))
+
+
+def _youtube_host(host: str) -> str:
+    """Normalise a hostname to youtube.com / youtu.be, or '' if not YouTube."""
+    host = host.lower()
+    if host == "youtu.be" or host.endswith(".youtu.be"):
+        return "youtu.be"
+    if host == "youtube.com" or host.endswith(".youtube.com"):
+        return "youtube.com"
+    if host == "youtube-nocookie.com" or host.endswith(".youtube-nocookie.com"):
+        return "youtube.com"
+    return ""
+
+
+def parse_video_id(url: str) -> str:
+    """
+    Return the video ID in `url`, or '' if it doesn't point at a video.
+    """
+    url = url.strip()
+    if len(url) == 11 and VIDEO_ID_PATTERN.fullmatch(url):
+        return url
+
+    match = VIDEO_URL_PATTERN.match(url)
+    if match:
+        return match.group(match.lastindex)
+    return _parse_with_urlsplit(url)
+
+
+def _parse_with_urlsplit(url: str) -> str:
+    """Slow path for URLs the fast pattern doesn't recognise."""
+    if "//" not in url:
+        url = "https://" + url
+    try:
+        parts = urlsplit(url)
+        host = _youtube_host(parts.hostname or "")
+    except ValueError:
+        return ""
+
+    candidate = ""
+    segments = [s for s in parts.path.split("/") if s]
+    if host == "youtu.be":
+        candidate = segments[0] if segments else ""
+    elif host == "youtube.com":
+        if segments == ["watch"] or not segments:
+            for pair in parts.query.split("&"):
+                if pair.startswith("v="):
+                    candidate = pair[2:]
+                    break
+        elif len(segments) >= 2 and segments[0] in _ID_PATH_PREFIXES:
+            candidate = segments[1]
+
+    if len(candidate) == 11 and VIDEO_ID_PATTERN.fullmatch(candidate):
+        return candidate
+    return ""
+
+
+def extract_video_id(url: str) -> str:
+    """
+    Extract YouTube video ID from various URL formats.
+
+    Raises:
+        ValueError: If the URL isn't a YouTube video URL
+    """
+    video_id = parse_video_id(url)
+    if not video_id:
+        raise ValueError(f"Could not extract video ID from URL: {url}")
+    return video_id
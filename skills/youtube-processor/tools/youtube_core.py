@@ -6,20 +6,24 @@ Used by both the Agent Skill (CLI) and FastAPI (HTTP).
 
 import re
 import os
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
-# Transcript extraction
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    TranscriptsDisabled,
-    NoTranscriptFound,
-    VideoUnavailable
-)
+# Claude API (the SDK itself loads on first use)
+from claude_client import get_client, call_with_retries, stream_with_retries
+from disk_cache import summary_cache, summary_key, transcript_cache, transcript_key
+from note_template import NoteTemplate
+from transcript_model import Transcript
+from transcript_source import fetch_transcript_model
+from vault_index import vault_index
+from video_url import extract_video_id
 
-# Claude API
-import anthropic
+CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+SUMMARY_MAX_TOKENS = 2000
 
 
 @dataclass
@@ -33,54 +37,64 @@ class ProcessingResult:
     markdown_output: Optional[str] = None
     error: Optional[str] = None
     saved_to: Optional[str] = None
+    # Multi-summary mode: one entry per summary type, plus seconds per step
+    summaries: Optional[Dict[str, str]] = None
+    timings: Optional[Dict[str, float]] = None
 
 
-def extract_video_id(url: str) -> str:
-    """
-    Extract YouTube video ID from various URL formats.
-    Handles: youtube.com/watch?v=ID, youtu.be/ID, youtube.com/embed/ID
+def get_transcript(video_id: str, use_cache: bool = True, normalize: bool = False) -> Tuple[str, str]:
     """
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'youtu\.be\/([0-9A-Za-z_-]{11})',
-        r'embed\/([0-9A-Za-z_-]{11})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    Fetch transcript from YouTube video.
+    Served from the shared disk cache when we've seen this video before.
+    Captions are verbatim unless `normalize` asks for them cleaned
+    (transcript_source.TRANSCRIPT_NORMALIZER).
+    Returns: (transcript_text, language_code)
 
-    raise ValueError(f"Could not extract video ID from URL: {url}")
+    Raises:
+        ValueError: If transcript unavailable (with reason)
+    """
+    transcript = get_segmented_transcript(video_id, use_cache=use_cache, normalize=normalize)
+    return transcript.text, transcript.language
 
 
-def get_transcript(video_id: str) -> Tuple[str, str]:
+def get_segmented_transcript(
+    video_id: str,
+    use_cache: bool = True,
+    normalize: bool = False
+) -> Transcript:
     """
-    Fetch transcript from YouTube video.
-    Returns: (transcript_text, language_code)
+    Like get_transcript, but keeps per-segment timing.
+    `.text` on the result is the joined transcript (no copy).
 
     Raises:
         ValueError: If transcript unavailable (with reason)
     """
-    try:
-        # New API is instance-based
-        ytt_api = YouTubeTranscriptApi()
-
-        # Try to fetch English transcript directly
-        try:
-            transcript_data = ytt_api.fetch(video_id, languages=['en'])
-            full_text = " ".join([item.text for item in transcript_data])
-            return full_text, 'en'
-        except:
-            # Fall back to listing and finding any available
-            transcript_list = ytt_api.list(video_id)
-            for transcript in transcript_list:
-                transcript_data = transcript.fetch()
-                full_text = " ".join([item.text for item in transcript_data])
-                return full_text, transcript.language_code
-
-        raise ValueError("No transcript found for this video")
+    cache = transcript_cache() if use_cache else None
+    key = transcript_key(video_id, normalized=normalize)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return Transcript.from_dict(hit)
+
+    transcript = _fetch_transcript(video_id, normalize)
+    if cache is not None:
+        cache.set(key, transcript.to_dict())
+    return transcript
+
+
+def _fetch_transcript(video_id: str, normalize: bool = False) -> Transcript:
+    """Fetch transcript from YouTube, bypassing the cache."""
+    # Imported here so transcript-free imports of this module stay light
+    from youtube_transcript_api._errors import (
+        TranscriptsDisabled,
+        NoTranscriptFound,
+        VideoUnavailable
+    )
 
+    try:
+        # English if there is one, otherwise whatever is available -
+        # one list call and one fetch either way
+        return fetch_transcript_model(video_id, languages=['en'], normalize=normalize)
     except TranscriptsDisabled:
         raise ValueError("Transcripts are disabled for this video")
     except NoTranscriptFound:
@@ -121,56 +135,288 @@ Write in Ed's voice: conversational, first-person, teaching through story."""
 def summarize_with_claude(
     transcript: str,
     summary_type: str = "detailed",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    use_cache: bool = True
 ) -> str:
     """
     Send transcript to Claude for summarization.
+    Identical requests (same transcript, prompt, model and max_tokens) are
+    answered from the summary cache without calling the API.
 
     Args:
         transcript: The video transcript text
         summary_type: One of "brief", "detailed", "bullets", "newsletter"
         api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+        use_cache: Set False to always call the API
 
     Returns:
         The summary text
     """
-    key = api_key or os.environ.get("ANTHROPIC_API_KEY")
-    if not key:
-        raise ValueError("ANTHROPIC_API_KEY not set")
+    prompt = SUMMARY_PROMPTS.get(summary_type, SUMMARY_PROMPTS["detailed"])
+    return _complete(prompt, transcript, api_key, use_cache)
+
+
+def _complete(
+    prompt: str,
+    transcript: str,
+    api_key: Optional[str] = None,
+    use_cache: bool = True
+) -> str:
+    """Run one prompt over a transcript, via the summary cache."""
+    cache = summary_cache() if use_cache else None
+    cache_key = summary_key(transcript, prompt, CLAUDE_MODEL, SUMMARY_MAX_TOKENS)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    client = get_client(api_key)
+
+    message = call_with_retries(lambda: client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=SUMMARY_MAX_TOKENS,
+        messages=[
+            {
+                "role": "user",
+                "content": f"{prompt}\n\nTranscript:\n{transcript}"
+            }
+        ]
+    ))
+
+    summary = message.content[0].text
+    if cache is not None:
+        cache.set(cache_key, summary)
+    return summary
+
+
+def stream_summary_with_claude(
+    transcript: str,
+    summary_type: str = "detailed",
+    api_key: Optional[str] = None,
+    use_cache: bool = True
+) -> Iterator[str]:
+    """
+    Streaming version of summarize_with_claude.
 
-    client = anthropic.Anthropic(api_key=key)
+    Yields text deltas as Claude produces them, so callers can show the
+    first words within a second instead of waiting for the full summary.
+    A cached summary is yielded in one piece; a completed stream is cached.
+    Callers that may stop early must close() the generator (see
+    claude_client.stream_with_retries) to free its concurrency slot.
+
+    Args:
+        transcript: The video transcript text
+        summary_type: One of "brief", "detailed", "bullets", "newsletter"
+        api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+        use_cache: Set False to always call the API
+
+    Yields:
+        Chunks of summary text, in order
+    """
     prompt = SUMMARY_PROMPTS.get(summary_type, SUMMARY_PROMPTS["detailed"])
 
-    message = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2000,
+    cache = summary_cache() if use_cache else None
+    cache_key = summary_key(transcript, prompt, CLAUDE_MODEL, SUMMARY_MAX_TOKENS)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+    client = get_client(api_key)
+
+    parts = []
+    deltas = stream_with_retries(lambda: client.messages.stream(
+        model=CLAUDE_MODEL,
+        max_tokens=SUMMARY_MAX_TOKENS,
         messages=[
             {
                 "role": "user",
                 "content": f"{prompt}\n\nTranscript:\n{transcript}"
             }
         ]
-    )
+    ))
+    # Closing us closes the API stream too
+    with closing(deltas):
+        for text in deltas:
+            parts.append(text)
+            yield text
 
-    return message.content[0].text
+    if cache is not None:
+        cache.set(cache_key, "".join(parts))
 
 
-def format_for_obsidian(
-    video_id: str,
-    url: str,
-    summary: str,
+def summarize_variants(
     transcript: str,
-    title: Optional[str] = None
+    summary_types: List[str],
+    max_workers: int = 8,
+    use_cache: bool = True
+) -> Tuple[Dict[str, str], Dict[str, float]]:
+    """
+    Produce several summary types from one transcript concurrently.
+
+    Args:
+        transcript: The video transcript text
+        summary_types: Keys of SUMMARY_PROMPTS to generate
+        max_workers: Upper bound on concurrent Claude calls
+        use_cache: Passed through to summarize_with_claude
+
+    Returns:
+        (summaries, timings) - both keyed by summary type, in request order
+    """
+    def run(summary_type: str) -> Tuple[str, float]:
+        started = time.perf_counter()
+        summary = summarize_with_claude(transcript, summary_type, use_cache=use_cache)
+        return summary, round(time.perf_counter() - started, 3)
+
+    workers = max(1, min(max_workers, len(summary_types)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {t: pool.submit(run, t) for t in summary_types}
+        results = {t: future.result() for t, future in futures.items()}
+
+    summaries = {t: summary for t, (summary, _) in results.items()}
+    timings = {t: elapsed for t, (_, elapsed) in results.items()}
+    return summaries, timings
+
+
+# Long-transcript map-reduce
+# Roughly 4 characters per token for English speech
+CHARS_PER_TOKEN = 4
+CHUNK_TOKEN_BUDGET = 8000
+# Above this, process_video condenses the transcript before summarizing
+LONG_TRANSCRIPT_TOKENS = 30000
+# Notes on one chunk can run to SUMMARY_MAX_TOKENS, so smaller chunks
+# can't shrink the text; and condensing stops after this many passes
+MIN_CHUNK_TOKENS = SUMMARY_MAX_TOKENS
+MAX_CONDENSE_PASSES = 3
+
+CHUNK_PROMPT = """This is one part of a longer video transcript.
+Write concise notes on this part: the key points, frameworks, stories,
+specific names, numbers and examples, and any action items.
+Notes only - no introduction or conclusion."""
+
+CONDENSED_HEADER = (
+    "[The full transcript was too long to read in one pass. "
+    "Below are notes on each part of it, in order.]"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate - good enough for chunk budgeting."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def chunk_transcript(transcript: str, max_tokens: int = CHUNK_TOKEN_BUDGET) -> List[str]:
+    """
+    Split flat text into chunks of at most ~max_tokens each.
+
+    Splits on sentence boundaries where there's punctuation, and falls
+    back to word boundaries otherwise. Used for text with no segment
+    timing - Transcript objects chunk on caption segments instead.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(transcript) <= max_chars:
+        return [transcript]
+
+    pieces = []
+    for sentence in re.split(r'(?<=[.!?])\s+', transcript):
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        # One "sentence" longer than a chunk - break it on words
+        words = sentence.split(" ")
+        current = []
+        size = 0
+        for word in words:
+            if current and size + len(word) + 1 > max_chars:
+                pieces.append(" ".join(current))
+                current, size = [], 0
+            current.append(word)
+            size += len(word) + 1
+        if current:
+            pieces.append(" ".join(current))
+
+    chunks = []
+    current = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(piece) + 1 > max_chars:
+            chunks.append(" ".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def condense_transcript(
+    transcript: Union[str, Transcript],
+    max_chunk_tokens: int = CHUNK_TOKEN_BUDGET,
+    max_workers: int = 8,
+    use_cache: bool = True
 ) -> str:
     """
-    Format output as Obsidian-compatible markdown with YAML frontmatter.
+    Map step of the long-transcript pipeline.
+
+    Splits the transcript into chunks (on caption segment boundaries when
+    given a Transcript with timing, on sentences otherwise), writes notes
+    on every chunk concurrently, and joins the notes in order. The result
+    is a much shorter stand-in for the transcript that any SUMMARY_PROMPTS
+    type can then be run over - so wall time is roughly one chunk, not the
+    whole video. Repeats until the notes themselves fit in one chunk, for
+    at most MAX_CONDENSE_PASSES passes, and stops early once a pass no
+    longer makes the text shorter.
+
+    Returns:
+        The condensed notes, or the transcript unchanged if it already fits
+
+    Raises:
+        ValueError: If max_chunk_tokens is below MIN_CHUNK_TOKENS
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    date_tag = datetime.now().strftime("%Y-%m-%d")
+    if max_chunk_tokens < MIN_CHUNK_TOKENS:
+        raise ValueError(f"max_chunk_tokens must be at least {MIN_CHUNK_TOKENS}")
+
+    segments = transcript if isinstance(transcript, Transcript) else None
+    original = text = segments.text if segments is not None else transcript
+    for _ in range(MAX_CONDENSE_PASSES):
+        if estimate_tokens(text) <= max_chunk_tokens:
+            break
+        if segments is not None:
+            chunks = segments.chunk_texts(max_chunk_tokens * CHARS_PER_TOKEN)
+            segments = None
+            if len(chunks) == 1:
+                # No usable timing (an untimed cache entry is one segment)
+                chunks = chunk_transcript(text, max_chunk_tokens)
+        else:
+            chunks = chunk_transcript(text, max_chunk_tokens)
+        if len(chunks) == 1:
+            break
+
+        workers = max(1, min(max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            notes = list(pool.map(
+                lambda chunk: _complete(CHUNK_PROMPT, chunk, use_cache=use_cache),
+                chunks
+            ))
+
+        condensed = "\n\n".join(
+            f"## Part {i} of {len(notes)}\n\n{part}"
+            for i, part in enumerate(notes, start=1)
+        )
+        if estimate_tokens(condensed) >= estimate_tokens(text):
+            # Notes no longer shrink the text - another pass only adds calls
+            break
+        text = condensed
+
+    if text is original:
+        return original
+    return f"{CONDENSED_HEADER}\n\n{text}"
 
-    display_title = title or f"YouTube Video {video_id}"
 
-    markdown = f"""---
+# Compiled once; rendered as a stream of chunks so a long transcript is
+# written to the vault without first being copied into one big string
+_OBSIDIAN_HEAD = """---
 source: YouTube
 video_id: {video_id}
 url: {url}
@@ -178,7 +424,7 @@ processed: {timestamp}
 tags: [youtube, video-notes]
 ---
 
-# {display_title}
+# {title}
 
 **Link**: [{url}]({url})
 **Processed**: {timestamp}
@@ -188,20 +434,64 @@ tags: [youtube, video-notes]
 {summary}
 
 ---
-
+"""
+_OBSIDIAN_TRANSCRIPT = """
 ## Full Transcript
 
 {transcript}
 
 ---
-
+"""
+_OBSIDIAN_FOOT = """
 _Generated by youtube-processor skill_
 """
-    return markdown
+OBSIDIAN_TEMPLATE = NoteTemplate(_OBSIDIAN_HEAD + _OBSIDIAN_TRANSCRIPT + _OBSIDIAN_FOOT)
+OBSIDIAN_SUMMARY_TEMPLATE = NoteTemplate(_OBSIDIAN_HEAD + _OBSIDIAN_FOOT)
+
+
+def obsidian_fields(
+    video_id: str,
+    url: str,
+    summary: str,
+    transcript: Optional[str] = None,
+    title: Optional[str] = None
+) -> Dict[str, str]:
+    """Template values for an Obsidian note (transcript may be left out)."""
+    fields = {
+        "video_id": video_id,
+        "url": url,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "title": title or f"YouTube Video {video_id}",
+        "summary": summary
+    }
+    if transcript is not None:
+        fields["transcript"] = transcript
+    return fields
+
+
+def obsidian_template(include_transcript: bool = True) -> NoteTemplate:
+    """The note template with or without the Full Transcript section."""
+    return OBSIDIAN_TEMPLATE if include_transcript else OBSIDIAN_SUMMARY_TEMPLATE
+
+
+def format_for_obsidian(
+    video_id: str,
+    url: str,
+    summary: str,
+    transcript: Optional[str],
+    title: Optional[str] = None
+) -> str:
+    """
+    Format output as Obsidian-compatible markdown with YAML frontmatter.
+    Pass transcript=None to leave out the Full Transcript section.
+    """
+    return obsidian_template(transcript is not None).render(
+        **obsidian_fields(video_id, url, summary, transcript, title)
+    )
 
 
 def save_to_obsidian(
-    content: str,
+    content: Union[str, Iterable[Tuple[str, bool]]],
     video_id: str,
     vault_path: str = "/Users/eddale/Documents/COPYobsidian/MAGI/Zettelkasten",
     title: Optional[str] = None
@@ -209,7 +499,14 @@ def save_to_obsidian(
     """
     Save markdown to Obsidian vault.
 
-    Returns: Path where file was saved
+    `content` is the note as a string, or NoteTemplate.bind(...) to
+    stream it to disk without building it in memory first.
+
+    Idempotent per video: if the vault's index already has a note for
+    `video_id`, that note is updated in place (or left alone when only
+    the processed timestamp differs) instead of creating a new file.
+
+    Returns: Path of the video's note
     """
     if not os.path.exists(vault_path):
         raise ValueError(f"Vault path does not exist: {vault_path}")
@@ -223,11 +520,7 @@ def save_to_obsidian(
     else:
         filename = f"YT - {video_id} - {timestamp}.md"
 
-    filepath = os.path.join(vault_path, filename)
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-
+    filepath, _ = vault_index(vault_path).write_note(video_id, content, filename)
     return filepath
 
 
@@ -235,49 +528,69 @@ def process_video(
     url: str,
     summary_type: str = "detailed",
     save_to_vault: bool = False,
-    vault_path: Optional[str] = None
+    vault_path: Optional[str] = None,
+    use_cache: bool = True,
+    summary_types: Optional[List[str]] = None,
+    max_workers: int = 8,
+    on_delta: Optional[Callable[[str], None]] = None,
+    map_reduce: Optional[bool] = None,
+    max_chunk_tokens: int = CHUNK_TOKEN_BUDGET,
+    include_transcript: bool = True,
+    build_markdown: bool = True
 ) -> ProcessingResult:
     """
     Full pipeline: URL -> Transcript -> Summary -> Obsidian markdown
 
     This is the main entry point for both CLI and API usage.
+
+    Pass `summary_types` to fan out: the transcript is fetched once and
+    every requested type is summarized concurrently (up to `max_workers`).
+    The result's `summaries` holds each variant; `summary` combines them.
+
+    Pass `on_delta` to stream a single summary: it's called with each text
+    chunk as Claude generates it.
+
+    Long transcripts go through map-reduce: chunks of `max_chunk_tokens`
+    are summarized in parallel and the final summary is written from those
+    notes. `map_reduce=None` switches this on automatically above
+    LONG_TRANSCRIPT_TOKENS; True/False forces it on or off.
+
+    `include_transcript=False` leaves the full transcript out of the
+    result (`transcript` is None and `markdown_output` has no transcript
+    section) for lean JSON/HTTP output. A saved note always includes it.
+
+    `build_markdown=False` skips `markdown_output` (None) - it's a second
+    full copy of the transcript, and a saved note is streamed from the
+    template instead. When both are wanted the note is rendered once and
+    that string is saved.
     """
     try:
         # Step 1: Extract video ID
         video_id = extract_video_id(url)
 
-        # Step 2: Get transcript
-        transcript, language = get_transcript(video_id)
-
-        # Step 3: Summarize with Claude
-        summary = summarize_with_claude(transcript, summary_type)
+        # Step 2: Get transcript, cleaned of [Music] etc. for Claude
+        started = time.perf_counter()
+        segments = get_segmented_transcript(video_id, use_cache=use_cache, normalize=True)
+        fetch_seconds = round(time.perf_counter() - started, 3)
 
-        # Step 4: Format for Obsidian
-        markdown = format_for_obsidian(
-            video_id=video_id,
+        result = process_transcript(
             url=url,
-            summary=summary,
-            transcript=transcript
-        )
-
-        # Step 5: Optionally save
-        saved_path = None
-        if save_to_vault:
-            default_vault = "/Users/eddale/Documents/COPYobsidian/MAGI/Zettelkasten"
-            saved_path = save_to_obsidian(
-                content=markdown,
-                video_id=video_id,
-                vault_path=vault_path or default_vault
-            )
-
-        return ProcessingResult(
-            success=True,
             video_id=video_id,
-            transcript=transcript,
-            summary=summary,
-            markdown_output=markdown,
-            saved_to=saved_path
+            segments=segments,
+            summary_type=summary_type,
+            save_to_vault=save_to_vault,
+            vault_path=vault_path,
+            use_cache=use_cache,
+            summary_types=summary_types,
+            max_workers=max_workers,
+            on_delta=on_delta,
+            map_reduce=map_reduce,
+            max_chunk_tokens=max_chunk_tokens,
+            include_transcript=include_transcript,
+            build_markdown=build_markdown
         )
+        result.timings = {"transcript": fetch_seconds, **result.timings}
+        return result
 
     except ValueError as e:
         return ProcessingResult(
@@ -291,3 +604,101 @@ def process_video(
             video_id="unknown",
             error=f"Unexpected error: {str(e)}"
         )
+
+
+def process_transcript(
+    url: str,
+    video_id: str,
+    segments: Transcript,
+    summary_type: str = "detailed",
+    save_to_vault: bool = False,
+    vault_path: Optional[str] = None,
+    use_cache: bool = True,
+    summary_types: Optional[List[str]] = None,
+    max_workers: int = 8,
+    on_delta: Optional[Callable[[str], None]] = None,
+    map_reduce: Optional[bool] = None,
+    max_chunk_tokens: int = CHUNK_TOKEN_BUDGET,
+    include_transcript: bool = True,
+    build_markdown: bool = True
+) -> ProcessingResult:
+    """
+    Steps 3-5 of process_video for a transcript that's already fetched:
+    Summary -> Obsidian markdown -> optional save.
+
+    Split out so batch runs can fetch and summarize in separate stages.
+    Options are as for process_video. Errors propagate to the caller.
+    """
+    transcript = segments.text
+    timings = {}
+
+    # Step 3a: Condense long transcripts (map step)
+    summary_input = transcript
+    if map_reduce is None:
+        map_reduce = estimate_tokens(transcript) > LONG_TRANSCRIPT_TOKENS
+    if map_reduce:
+        started = time.perf_counter()
+        summary_input = condense_transcript(
+            segments, max_chunk_tokens, max_workers, use_cache=use_cache
+        )
+        timings["condense"] = round(time.perf_counter() - started, 3)
+
+    # Step 3b: Summarize with Claude
+    summaries = None
+    if summary_types:
+        summaries, variant_timings = summarize_variants(
+            summary_input, summary_types, max_workers, use_cache=use_cache
+        )
+        timings.update(variant_timings)
+        summary = "\n\n".join(
+            f"### {summary_type.title()}\n\n{text}"
+            for summary_type, text in summaries.items()
+        )
+    elif on_delta is not None:
+        started = time.perf_counter()
+        parts = []
+        deltas = stream_summary_with_claude(summary_input, summary_type, use_cache=use_cache)
+        with closing(deltas):
+            for text in deltas:
+                parts.append(text)
+                on_delta(text)
+        summary = "".join(parts)
+        timings[summary_type] = round(time.perf_counter() - started, 3)
+    else:
+        started = time.perf_counter()
+        summary = summarize_with_claude(summary_input, summary_type, use_cache=use_cache)
+        timings[summary_type] = round(time.perf_counter() - started, 3)
+
+    # Step 4: Format for Obsidian - only if the caller wants the string
+    fields = obsidian_fields(
+        video_id, url, summary, transcript if include_transcript else None
+    )
+    markdown = None
+    if build_markdown:
+        markdown = obsidian_template(include_transcript).render(**fields)
+
+    # Step 5: Optionally save - the string above if it's the full note,
+    # otherwise streamed from the template, never joined
+    saved_path = None
+    if save_to_vault:
+        default_vault = "/Users/eddale/Documents/COPYobsidian/MAGI/Zettelkasten"
+        if markdown is not None and include_transcript:
+            note = markdown
+        else:
+            note = OBSIDIAN_TEMPLATE.bind(**{**fields, "transcript": transcript})
+        saved_path = save_to_obsidian(
+            content=note,
+            video_id=video_id,
+            vault_path=vault_path or default_vault
+        )
+
+    return ProcessingResult(
+        success=True,
+        video_id=video_id,
+        transcript=transcript if include_transcript else None,
+        summary=summary,
+        markdown_output=markdown,
+        saved_to=saved_path,
+        summaries=summaries,
+        timings=timings
+    )